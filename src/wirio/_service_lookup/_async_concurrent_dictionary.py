@@ -2,6 +2,7 @@ from collections.abc import Awaitable, Callable
 from typing import Final
 
 from wirio._service_lookup._asyncio_reentrant_lock import AsyncioReentrantLock
+from wirio.wirio_undefined import WirioUndefined
 
 
 class AsyncConcurrentDictionary[TKey, TValue]:
@@ -17,14 +18,15 @@ class AsyncConcurrentDictionary[TKey, TValue]:
     async def get_or_add(
         self, key: TKey, value_factory: Callable[[TKey], Awaitable[TValue]]
     ) -> TValue:
-        if key not in self._dict:
-            value = await value_factory(key)
+        existing_value = self._dict.get(key, WirioUndefined.INSTANCE)
 
-            async with self._lock:
-                if key not in self._dict:
-                    self._dict[key] = value
+        if not isinstance(existing_value, WirioUndefined):
+            return existing_value
 
-        return self._dict[key]
+        value = await value_factory(key)
+
+        async with self._lock:
+            return self._dict.setdefault(key, value)
 
     def get(self, key: TKey) -> TValue | None:
         return self._dict.get(key)
@@ -33,6 +35,6 @@ class AsyncConcurrentDictionary[TKey, TValue]:
         async with self._lock:
             self._dict[key] = value
 
-    async def try_remove(self, key: TKey) -> None:
-        async with self._lock:
-            self._dict.pop(key, None)
+    def try_remove(self, key: TKey) -> None:
+        # A single `dict.pop` can't be interleaved with other coroutines, so it doesn't need the lock
+        self._dict.pop(key, None)
@@ -67,17 +67,24 @@ class AsyncioReentrantLock(AbstractAsyncContextManager["AsyncioReentrantLock"]):
     async def acquire(self) -> None:
         current_task = asyncio.current_task()
 
+        if not self._try_acquire_immediately(current_task):
+            await self._wait_and_acquire(current_task)
+
+    def _try_acquire_immediately(self, current_task: Task[Any] | None) -> bool:
         # If the lock is reentrant, acquire it immediately
         if self.is_owner(task=current_task):
             self._count += 1
-            return
+            return True
 
         # If the lock is free (and ownership not in midst of transfer), acquire it immediately
         if self._count == 0 and not self._owner_transfer:
             self._owner = current_task
             self._count = 1
-            return
+            return True
+
+        return False
 
+    async def _wait_and_acquire(self, current_task: Task[Any] | None) -> None:
         # Create an event for this task, to notify when it's ready for acquire
         event = Event()
         self._queue.append(event)
@@ -131,7 +138,12 @@ class AsyncioReentrantLock(AbstractAsyncContextManager["AsyncioReentrantLock"]):
 
     @override
     async def __aenter__(self) -> Self:
-        await self.acquire()
+        current_task = asyncio.current_task()
+
+        # Uncontended acquisitions don't need the extra `acquire` coroutine
+        if not self._try_acquire_immediately(current_task):
+            await self._wait_and_acquire(current_task)
+
         return self
 
     @override
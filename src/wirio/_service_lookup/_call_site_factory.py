@@ -1,5 +1,6 @@
+from collections import defaultdict
 from collections.abc import Generator, Iterator, Sequence
-from contextlib import contextmanager, suppress
+from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import ClassVar, Final, final, override
 
@@ -74,70 +75,42 @@ from wirio.service_descriptor import ServiceDescriptor
 
 @final
 class ServiceDescriptorCacheItem:
-    _item: ServiceDescriptor | None
-    _items: list[ServiceDescriptor] | None
+    __slots__ = ("_indexes", "_items")
+
+    _items: Final[list[ServiceDescriptor]]
+    # Position of each descriptor in :attr:`_items`, so validating every registration isn't quadratic
+    _indexes: Final[dict[ServiceDescriptor, int]]
 
     def __init__(self) -> None:
-        self._item = None
-        self._items = None
+        self._items = []
+        self._indexes = {}
 
     @property
     def last(self) -> ServiceDescriptor:
-        if self._items is not None and len(self._items) > 0:
-            return self._items[len(self._items) - 1]
-
-        assert self._item is not None
-        return self._item
-
-    def add(self, descriptor: ServiceDescriptor) -> "ServiceDescriptorCacheItem":
-        new_cache_item = ServiceDescriptorCacheItem()
+        return self._items[-1]
 
-        if self._item is None:
-            new_cache_item._item = descriptor
-        else:
-            new_cache_item._item = self._item
-            new_cache_item._items = list(self._items) if self._items is not None else []
-            new_cache_item._items.append(descriptor)
-
-        return new_cache_item
+    def add(self, descriptor: ServiceDescriptor) -> None:
+        self._indexes.setdefault(descriptor, len(self._items))
+        self._items.append(descriptor)
 
     def __len__(self) -> int:
-        if self._item is None:
-            assert self._items is None
-            return 0
-
-        items_count = len(self._items) if self._items is not None else 0
-        return items_count + 1
+        return len(self._items)
 
     def get_slot(self, service_descriptor: ServiceDescriptor) -> int:
-        if service_descriptor == self._item:
-            return len(self) - 1
+        index = self._indexes.get(service_descriptor)
 
-        if self._items is not None:
-            index: int | None = None
+        if index is None:
+            raise ServiceDescriptorDoesNotExistError
 
-            with suppress(ValueError):
-                index = self._items.index(service_descriptor)
-
-            if index is not None:
-                return len(self._items) - (index + 1)
-
-        raise ServiceDescriptorDoesNotExistError
+        # The last registration gets slot 0
+        return len(self._items) - (index + 1)
 
     def __iter__(self) -> Iterator[ServiceDescriptor]:
-        if self._item is None:
-            return iter([])
-
-        if self._items is None:
-            return iter([self._item])
-
-        items: list[ServiceDescriptor] = [self._item]
-        items.extend(self._items)
-        return iter(items)
+        return iter(self._items)
 
 
 @final
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _ServiceOverride:
     exists: bool
     value: object | None = None
@@ -146,31 +119,55 @@ class _ServiceOverride:
 @final
 class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
     _DEFAULT_SLOT: ClassVar[int] = 0
+    _SEQUENCE_TYPE: ClassVar[TypedType] = TypedType.from_type(Sequence)
+    _NO_SERVICE_OVERRIDE: ClassVar[_ServiceOverride] = _ServiceOverride(exists=False)
+    _BUILT_IN_SERVICE_TYPES: ClassVar[frozenset[TypedType]] = frozenset(
+        (
+            TypedType.from_type(BaseServiceProvider),
+            TypedType.from_type(ServiceScopeFactory),
+            TypedType.from_type(ServiceProviderIsService),
+            TypedType.from_type(ServiceProviderIsKeyedService),
+        )
+    )
 
     _descriptors: Final[list[ServiceDescriptor]]
     _descriptor_lookup: Final[dict[ServiceIdentifier, ServiceDescriptorCacheItem]]
-    _call_site_cache: Final[AsyncConcurrentDictionary[ServiceCacheKey, ServiceCallSite]]
+    # Descriptors in registration order, grouped by service type, so sequences only visit matching descriptors
+    _descriptors_by_service_type: Final[dict[TypedType, list[ServiceDescriptor]]]
+    # Call sites are created under a lock per service identifier, and single dictionary operations
+    # can't be interleaved by other coroutines, so a plain dictionary avoids awaiting on every write
+    _call_site_cache: Final[dict[ServiceCacheKey, ServiceCallSite]]
+    # Most lookups use the default slot, so their keys are reused instead of being allocated on every resolution
+    _default_slot_cache_keys: Final[dict[ServiceIdentifier, ServiceCacheKey]]
     _call_site_locks: Final[
         AsyncConcurrentDictionary[ServiceIdentifier, AsyncioReentrantLock]
     ]
     _service_overrides: Final[dict[ServiceIdentifier, list[object | None]]]
-    _service_type_to_cache_keys: Final[dict[TypedType, set[ServiceCacheKey]]]
+    # Service types with an `ANY_KEY` override, so keyed lookups only build the catch-all identifier when it can match
+    _any_key_overridden_service_types: Final[set[TypedType]]
+    _service_type_to_cache_keys: Final[defaultdict[TypedType, set[ServiceCacheKey]]]
     _dirty_service_types: Final[set[TypedType]]
     _service_type_invalidation_lock: Final[AsyncioReentrantLock]
+    # Inspecting a constructor is expensive, and an implementation type can back several call sites
+    _constructor_informations: Final[
+        dict[TypedType, tuple[ConstructorInformation, list[ParameterInformation]]]
+    ]
 
     def __init__(self, descriptors: list["ServiceDescriptor"]) -> None:
         self._descriptors = descriptors.copy()
         self._descriptor_lookup = {}
-        self._call_site_cache = AsyncConcurrentDictionary[
-            ServiceCacheKey, ServiceCallSite
-        ]()
+        self._descriptors_by_service_type = {}
+        self._call_site_cache = {}
+        self._default_slot_cache_keys = {}
         self._call_site_locks = AsyncConcurrentDictionary[
             ServiceIdentifier, AsyncioReentrantLock
         ]()
         self._service_overrides = {}
-        self._service_type_to_cache_keys = {}
+        self._any_key_overridden_service_types = set()
+        self._service_type_to_cache_keys = defaultdict(set)
         self._dirty_service_types = set()
         self._service_type_invalidation_lock = AsyncioReentrantLock()
+        self._constructor_informations = {}
         self._populate(self._descriptors)
 
     @override
@@ -192,16 +189,22 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
     async def get_call_site_from_service_identifier(
         self, service_identifier: ServiceIdentifier, call_site_chain: CallSiteChain
     ) -> ServiceCallSite | None:
-        await self._invalidate_service_type_if_needed(service_identifier.service_type)
+        # Checked before awaiting, so the steady state doesn't create a coroutine per resolution
+        if service_identifier.service_type in self._dirty_service_types:
+            await self._invalidate_service_type(service_identifier.service_type)
+
         overridden_call_site = self.get_overridden_call_site(service_identifier)
 
         if overridden_call_site is not None:
             return overridden_call_site
 
-        service_cache_key = self._create_service_cache_key(
-            service_identifier, self._DEFAULT_SLOT
+        # Default-slot call sites are always cached under a reused key, so a missing key means a missing call site
+        service_cache_key = self._default_slot_cache_keys.get(service_identifier)
+        service_call_site = (
+            None
+            if service_cache_key is None
+            else self._call_site_cache.get(service_cache_key)
         )
-        service_call_site = self._call_site_cache.get(service_cache_key)
 
         if service_call_site is None:
             return await self._create_call_site(
@@ -213,7 +216,9 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
     async def get_call_site_from_service_descriptor(
         self, service_descriptor: ServiceDescriptor, call_site_chain: CallSiteChain
     ) -> ServiceCallSite | None:
-        await self._invalidate_service_type_if_needed(service_descriptor.service_type)
+        if service_descriptor.service_type in self._dirty_service_types:
+            await self._invalidate_service_type(service_descriptor.service_type)
+
         service_identifier = ServiceIdentifier.from_descriptor(service_descriptor)
         service_descriptor_cache_item = self._descriptor_lookup.get(service_identifier)
 
@@ -227,13 +232,13 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
 
         return None
 
-    async def add(
+    def add(
         self, service_identifier: ServiceIdentifier, service_call_site: ServiceCallSite
     ) -> None:
         cache_key = self._create_service_cache_key(
             service_identifier, self._DEFAULT_SLOT
         )
-        await self._call_site_cache.upsert(key=cache_key, value=service_call_site)
+        self._call_site_cache[cache_key] = service_call_site
         self._track_cache_key(service_identifier.service_type, cache_key)
 
     @contextmanager
@@ -265,7 +270,7 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
 
     def add_descriptor(self, descriptor: ServiceDescriptor) -> None:
         self._descriptors.append(descriptor)
-        self._populate([descriptor])
+        self._populate_descriptor(descriptor)
         self.mark_service_type_dirty(descriptor.service_type)
 
     def mark_service_type_dirty(self, service_type: TypedType) -> None:
@@ -274,7 +279,9 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
     async def try_create_sequence(  # noqa: C901, PLR0915
         self, service_identifier: ServiceIdentifier, call_site_chain: CallSiteChain
     ) -> ServiceCallSite | None:
-        call_site_key = ServiceCacheKey(service_identifier, slot=self._DEFAULT_SLOT)
+        call_site_key = self._create_service_cache_key(
+            service_identifier, self._DEFAULT_SLOT
+        )
 
         if (service_call_site := self._call_site_cache.get(call_site_key)) is not None:
             return service_call_site
@@ -285,8 +292,7 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
 
             if (
                 not service_type.is_generic_type
-                or service_type.get_generic_type_definition()
-                != TypedType.from_type(Sequence)
+                or service_type.get_generic_type_definition() != self._SEQUENCE_TYPE
             ):
                 return None
 
@@ -331,7 +337,8 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
                 # iterate over the descriptors twice in reverse, catching exact matches on the first pass
                 # and open generic matches on the second pass.
 
-                service_call_sites_by_index: list[tuple[int, ServiceCallSite]] = []
+                # The descriptors are visited in reverse declaration order, so the call sites are reversed at the end
+                reversed_service_call_sites: list[ServiceCallSite] = []
                 keyed_slot_assignment: dict[ServiceIdentifier, int] | None = None
                 slot = 0
 
@@ -377,14 +384,12 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
                     keyed_slot_assignment[key] = 0
                     return 0
 
-                def add_service_call_site(
-                    service_call_site: ServiceCallSite, index: int
-                ) -> None:
+                def add_service_call_site(service_call_site: ServiceCallSite) -> None:
                     nonlocal cache_location
                     cache_location = self._get_common_cache_location(
                         cache_location, service_call_site.cache.location
                     )
-                    service_call_sites_by_index.append((index, service_call_site))
+                    reversed_service_call_sites.append(service_call_site)
 
                 def update_slot(key: ServiceIdentifier) -> None:
                     if not is_any_key_lookup:
@@ -395,13 +400,11 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
                         keyed_slot_assignment[key] = slot + 1
 
                 # Do the exact matches first
-                for i, service_descriptor in reversed(
-                    list(enumerate(self._descriptors))
+                for service_descriptor in reversed(
+                    self._descriptors_by_service_type.get(cache_key.service_type, [])
                 ):
                     if keys_match(
                         cache_key.service_key, service_descriptor.service_key
-                    ) and self._should_create_exact(
-                        service_descriptor.service_type, cache_key.service_type
                     ):
                         # For `ANY_KEY`, we want to cache based on descriptor identity, not `ANY_KEY` that cacheKey has
                         registration_key = (
@@ -416,11 +419,11 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
                             call_site_chain=call_site_chain,
                             slot=slot,
                         )
-                        add_service_call_site(service_call_site, i)
+                        add_service_call_site(service_call_site)
                         update_slot(registration_key)
 
-                service_call_sites_by_index.sort(key=lambda x: x[0])
-                service_call_sites = [x[1] for x in service_call_sites_by_index]
+                reversed_service_call_sites.reverse()
+                service_call_sites = reversed_service_call_sites
 
             result_cache = (
                 ResultCache(cache_location, call_site_key)
@@ -434,16 +437,13 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
                 service_call_sites=service_call_sites,
                 service_key=service_identifier.service_key,
             )
-            await self._call_site_cache.upsert(call_site_key, sequence_call_site)
+            self._call_site_cache[call_site_key] = sequence_call_site
             return sequence_call_site
 
         finally:
             call_site_chain.remove(service_identifier)
 
-    async def _invalidate_service_type_if_needed(self, service_type: TypedType) -> None:
-        if service_type not in self._dirty_service_types:
-            return
-
+    async def _invalidate_service_type(self, service_type: TypedType) -> None:
         async with self._service_type_invalidation_lock:
             if service_type not in self._dirty_service_types:
                 return
@@ -451,20 +451,28 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
             cache_keys = self._service_type_to_cache_keys.pop(service_type, set())
 
             for cache_key in cache_keys:
-                await self._call_site_cache.try_remove(cache_key)
+                self._call_site_cache.pop(cache_key, None)
 
             self._dirty_service_types.remove(service_type)
 
     def _create_service_cache_key(
         self, service_identifier: ServiceIdentifier, slot: int
     ) -> ServiceCacheKey:
-        return ServiceCacheKey(service_identifier, slot)
+        if slot != self._DEFAULT_SLOT:
+            return ServiceCacheKey(service_identifier, slot)
+
+        cache_key = self._default_slot_cache_keys.get(service_identifier)
+
+        if cache_key is None:
+            cache_key = ServiceCacheKey(service_identifier, slot)
+            self._default_slot_cache_keys[service_identifier] = cache_key
+
+        return cache_key
 
     def _track_cache_key(
         self, service_type: TypedType, cache_key: ServiceCacheKey
     ) -> None:
-        cache_keys = self._service_type_to_cache_keys.setdefault(service_type, set())
-        cache_keys.add(cache_key)
+        self._service_type_to_cache_keys[service_type].add(cache_key)
 
     async def _create_call_site(
         self, service_identifier: ServiceIdentifier, call_site_chain: CallSiteChain
@@ -501,11 +509,23 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
 
     def _populate(self, descriptors: list[ServiceDescriptor]) -> None:
         for descriptor in descriptors:
-            cache_key = ServiceIdentifier.from_descriptor(descriptor)
-            cache_item = self._descriptor_lookup.get(
-                cache_key, ServiceDescriptorCacheItem()
-            )
-            self._descriptor_lookup[cache_key] = cache_item.add(descriptor)
+            self._populate_descriptor(descriptor)
+
+    def _populate_descriptor(self, descriptor: ServiceDescriptor) -> None:
+        cache_key = ServiceIdentifier.from_descriptor(descriptor)
+        cache_item = self._descriptor_lookup.get(cache_key)
+
+        if cache_item is None:
+            cache_item = ServiceDescriptorCacheItem()
+            self._descriptor_lookup[cache_key] = cache_item
+
+        cache_item.add(descriptor)
+        descriptors = self._descriptors_by_service_type.get(descriptor.service_type)
+
+        if descriptors is None:
+            self._descriptors_by_service_type[descriptor.service_type] = [descriptor]
+        else:
+            descriptors.append(descriptor)
 
     async def _try_create_exact_from_service_identifier(
         self, service_identifier: ServiceIdentifier, call_site_chain: CallSiteChain
@@ -550,20 +570,13 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
         call_site_chain: CallSiteChain,
         slot: int,
     ) -> ServiceCallSite | None:
-        if not self._should_create_exact(
-            service_descriptor.service_type, service_identifier.service_type
-        ):
+        if service_descriptor.service_type != service_identifier.service_type:
             return None
 
         return await self._create_exact(
             service_descriptor, service_identifier, call_site_chain, slot
         )
 
-    def _should_create_exact(
-        self, descriptor_type: TypedType, service_type: TypedType
-    ) -> bool:
-        return descriptor_type == service_type
-
     async def _create_exact(  # noqa: C901
         self,
         service_descriptor: ServiceDescriptor,
@@ -677,31 +690,41 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
         else:
             raise InvalidServiceDescriptorError
 
-        await self._call_site_cache.upsert(key=call_site_key, value=service_call_site)
+        self._call_site_cache[call_site_key] = service_call_site
         self._track_cache_key(service_identifier.service_type, call_site_key)
         return service_call_site
 
     def _get_service_override(
         self, service_identifier: ServiceIdentifier
     ) -> _ServiceOverride:
+        # Overrides are usually only active in tests, so skip the lookups (and the catch-all identifier) when there are none
+        if len(self._service_overrides) == 0:
+            return self._NO_SERVICE_OVERRIDE
+
         overrides = self._service_overrides.get(service_identifier)
 
         if overrides is not None and len(overrides) > 0:
             return _ServiceOverride(exists=True, value=overrides[-1])
 
+        if (
+            service_identifier.service_type
+            not in self._any_key_overridden_service_types
+        ):
+            return self._NO_SERVICE_OVERRIDE
+
         catch_all_identifier = self._get_catch_all_service_identifier(
             service_identifier
         )
 
         if catch_all_identifier is None:
-            return _ServiceOverride(exists=False, value=None)
+            return self._NO_SERVICE_OVERRIDE
 
         overrides = self._service_overrides.get(catch_all_identifier)
 
         if overrides is not None and len(overrides) > 0:
             return _ServiceOverride(exists=True, value=overrides[-1])
 
-        return _ServiceOverride(exists=False, value=None)
+        return self._NO_SERVICE_OVERRIDE
 
     def _get_catch_all_service_identifier(
         self, service_identifier: ServiceIdentifier
@@ -725,6 +748,9 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
         overrides = self._service_overrides.setdefault(service_identifier, [])
         overrides.append(implementation_instance)
 
+        if service_identifier.service_key == KeyedService.ANY_KEY:
+            self._any_key_overridden_service_types.add(service_identifier.service_type)
+
     def _remove_override(self, service_identifier: ServiceIdentifier) -> None:
         overrides = self._service_overrides.get(service_identifier)
         assert overrides is not None
@@ -733,6 +759,11 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
         if len(overrides) == 0:
             self._service_overrides.pop(service_identifier)
 
+            if service_identifier.service_key == KeyedService.ANY_KEY:
+                self._any_key_overridden_service_types.discard(
+                    service_identifier.service_type
+                )
+
     async def _create_constructor_call_site(
         self,
         cache: ResultCache,
@@ -743,8 +774,9 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
         try:
             call_site_chain.add(service_identifier, implementation_type)
             parameter_call_sites: list[ServiceCallSite | None] | None = None
-            constructor_information = ConstructorInformation(implementation_type)
-            parameters = constructor_information.get_parameters()
+            constructor_information, parameters = self._get_constructor_information(
+                implementation_type
+            )
             parameter_call_sites = await self._create_argument_call_sites(
                 service_identifier=service_identifier,
                 implementation_type=implementation_type,
@@ -762,6 +794,22 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
         finally:
             call_site_chain.remove(service_identifier)
 
+    def _get_constructor_information(
+        self, implementation_type: TypedType
+    ) -> tuple[ConstructorInformation, list[ParameterInformation]]:
+        constructor_information = self._constructor_informations.get(
+            implementation_type
+        )
+
+        if constructor_information is None:
+            information = ConstructorInformation(implementation_type)
+            constructor_information = (information, information.get_parameters())
+            self._constructor_informations[implementation_type] = (
+                constructor_information
+            )
+
+        return constructor_information
+
     async def _create_argument_call_sites(  # noqa: C901, PLR0912
         self,
         service_identifier: ServiceIdentifier,
@@ -855,19 +903,14 @@ class CallSiteFactory(ServiceProviderIsKeyedService, ServiceProviderIsService):
 
         if (
             service_identifier.service_key is not None
-            and ServiceIdentifier(
+            and ServiceIdentifier.from_service_type(
                 service_type=service_type, service_key=KeyedService.ANY_KEY
             )
             in self._descriptor_lookup
         ):
             return True
 
-        return (
-            service_type == TypedType.from_type(BaseServiceProvider)
-            or service_type == TypedType.from_type(ServiceScopeFactory)
-            or service_type == TypedType.from_type(ServiceProviderIsService)
-            or service_type == TypedType.from_type(ServiceProviderIsKeyedService)
-        )
+        return service_type in self._BUILT_IN_SERVICE_TYPES
 
     def _get_common_cache_location(
         self,
@@ -6,9 +6,11 @@ from dataclasses import dataclass
 from enum import Flag
 from types import TracebackType
 from typing import (
+    TYPE_CHECKING,
     ClassVar,
     Final,
     Self,
+    cast,
     final,
     override,
 )
@@ -26,6 +28,7 @@ from wirio._service_lookup._constant_call_site import (
 from wirio._service_lookup._constructor_call_site import (
     ConstructorCallSite,
 )
+from wirio._service_lookup._disposable_kind import DisposableKind
 from wirio._service_lookup._parameter_information import (
     ParameterInformation,
 )
@@ -36,12 +39,6 @@ from wirio._service_lookup._service_call_site import (
 from wirio._service_lookup._service_provider_call_site import (
     ServiceProviderCallSite,
 )
-from wirio._service_lookup._supports_async_context_manager import (
-    SupportsAsyncContextManager,
-)
-from wirio._service_lookup._supports_sync_context_manager import (
-    SupportsSyncContextManager,
-)
 from wirio._service_lookup._sync_factory_call_site import (
     SyncFactoryCallSite,
 )
@@ -59,6 +56,14 @@ from wirio.service_provider_engine_scope import (
 )
 from wirio.wirio_undefined import WirioUndefined
 
+if TYPE_CHECKING:
+    from wirio._service_lookup._supports_async_context_manager import (
+        SupportsAsyncContextManager,
+    )
+    from wirio._service_lookup._supports_sync_context_manager import (
+        SupportsSyncContextManager,
+    )
+
 
 class _RuntimeResolverLock(Flag):
     NONE = 0
@@ -314,11 +319,7 @@ class CallSiteRuntimeResolver(CallSiteVisitor[RuntimeResolverContext, object | N
 
         service = constructor_call_site.constructor_information.invoke(parameter_values)
 
-        if isinstance(service, SupportsAsyncContextManager):
-            await service.__aenter__()
-        elif isinstance(service, SupportsSyncContextManager):
-            service.__enter__()
-
+        await self._enter_context(service)
         return service
 
     @override
@@ -340,11 +341,7 @@ class CallSiteRuntimeResolver(CallSiteVisitor[RuntimeResolverContext, object | N
         )
         service = sync_factory_call_site.implementation_factory(*parameter_services)
 
-        if isinstance(service, SupportsAsyncContextManager):
-            await service.__aenter__()
-        elif isinstance(service, SupportsSyncContextManager):
-            service.__enter__()
-
+        await self._enter_context(service)
         return service
 
     @override
@@ -360,11 +357,7 @@ class CallSiteRuntimeResolver(CallSiteVisitor[RuntimeResolverContext, object | N
             *parameter_services
         )
 
-        if isinstance(service, SupportsAsyncContextManager):
-            await service.__aenter__()
-        elif isinstance(service, SupportsSyncContextManager):
-            service.__enter__()
-
+        await self._enter_context(service)
         return service
 
     @override
@@ -474,6 +467,15 @@ class CallSiteRuntimeResolver(CallSiteVisitor[RuntimeResolverContext, object | N
             if parameter_name != "return"
         ]
 
+    async def _enter_context(self, service: object | None) -> None:
+        match DisposableKind.from_instance(service):
+            case DisposableKind.ASYNC:
+                await cast("SupportsAsyncContextManager", service).__aenter__()
+            case DisposableKind.SYNC:
+                cast("SupportsSyncContextManager", service).__enter__()
+            case DisposableKind.NONE:
+                pass
+
     def _build_constructor_parameter_resolution_error(
         self, parameter_information: ParameterInformation, service_type: TypedType
     ) -> RuntimeError:
@@ -1,7 +1,6 @@
 from dataclasses import dataclass
 from typing import Final, final, override
 
-from wirio._service_lookup._async_concurrent_dictionary import AsyncConcurrentDictionary
 from wirio._service_lookup._async_factory_call_site import AsyncFactoryCallSite
 from wirio._service_lookup._async_generator_factory_call_site import (
     AsyncGeneratorFactoryCallSite,
@@ -25,23 +24,23 @@ from wirio.exceptions import (
     ScopedInSingletonError,
     ScopedResolvedFromRootError,
 )
+from wirio.wirio_undefined import WirioUndefined
 
 
 @final
-@dataclass
+@dataclass(slots=True)
 class _CallSiteValidatorState:
     singleton: ServiceCallSite | None
 
 
 @final
 class CallSiteValidator(CallSiteVisitor[_CallSiteValidatorState, TypedType | None]):
-    # Keys are services being resolved via `get_service`, values - first scoped service in their call site tree
-    _scoped_services: Final[
-        AsyncConcurrentDictionary[ServiceCacheKey, TypedType | None]
-    ]
+    # Keys are services being resolved via `get_service`, values - first scoped service in their call site tree.
+    # Single dictionary operations can't be interleaved by other coroutines, so no lock is needed
+    _scoped_services: Final[dict[ServiceCacheKey, TypedType | None]]
 
     def __init__(self) -> None:
-        self._scoped_services = AsyncConcurrentDictionary()
+        self._scoped_services = {}
 
     @override
     async def _visit_call_site(
@@ -52,20 +51,46 @@ class CallSiteValidator(CallSiteVisitor[_CallSiteValidatorState, TypedType | Non
         # If first_scoped_service_in_call_site_tree has a value, it contains the first scoped service in this service's call site tree
 
         first_scoped_service_in_call_site_tree = self._scoped_services.get(
-            call_site.cache.key
+            call_site.cache.key, WirioUndefined.INSTANCE
         )
 
-        if first_scoped_service_in_call_site_tree is None:
+        if isinstance(first_scoped_service_in_call_site_tree, WirioUndefined):
             # This call site wasn't cached yet, walk the tree
             first_scoped_service_in_call_site_tree = await super()._visit_call_site(
                 call_site, argument
             )
 
             # Cache the result
-            await self._scoped_services.upsert(
-                call_site.cache.key, first_scoped_service_in_call_site_tree
+            self._scoped_services[call_site.cache.key] = (
+                first_scoped_service_in_call_site_tree
             )
 
+        self._ensure_not_scoped_in_singleton(
+            call_site, first_scoped_service_in_call_site_tree, argument
+        )
+        return first_scoped_service_in_call_site_tree
+
+    def _try_visit_visited_call_site(
+        self, call_site: ServiceCallSite, argument: _CallSiteValidatorState
+    ) -> TypedType | None | WirioUndefined:
+        """Visit a call site whose tree has already been visited, without creating a coroutine."""
+        first_scoped_service_in_call_site_tree = self._scoped_services.get(
+            call_site.cache.key, WirioUndefined.INSTANCE
+        )
+
+        if not isinstance(first_scoped_service_in_call_site_tree, WirioUndefined):
+            self._ensure_not_scoped_in_singleton(
+                call_site, first_scoped_service_in_call_site_tree, argument
+            )
+
+        return first_scoped_service_in_call_site_tree
+
+    def _ensure_not_scoped_in_singleton(
+        self,
+        call_site: ServiceCallSite,
+        first_scoped_service_in_call_site_tree: TypedType | None,
+        argument: _CallSiteValidatorState,
+    ) -> None:
         # If there is a scoped service in the call site tree, make sure we are not resolving it from a singleton
         if (
             first_scoped_service_in_call_site_tree is not None
@@ -75,8 +100,6 @@ class CallSiteValidator(CallSiteVisitor[_CallSiteValidatorState, TypedType | Non
                 call_site.service_type, argument.singleton.service_type
             )
 
-        return first_scoped_service_in_call_site_tree
-
     async def _visit_root_cache(
         self, call_site: ServiceCallSite, argument: _CallSiteValidatorState
     ) -> TypedType | None:
@@ -103,7 +126,12 @@ class CallSiteValidator(CallSiteVisitor[_CallSiteValidatorState, TypedType | Non
 
         for parameter_call_site in constructor_call_site.parameter_call_sites:
             if parameter_call_site is not None:
-                scoped = await self._visit_call_site(parameter_call_site, argument)
+                scoped = self._try_visit_visited_call_site(
+                    parameter_call_site, argument
+                )
+
+                if isinstance(scoped, WirioUndefined):
+                    scoped = await self._visit_call_site(parameter_call_site, argument)
 
                 if scoped is not None and result is None:
                     result = scoped
@@ -155,7 +183,10 @@ class CallSiteValidator(CallSiteVisitor[_CallSiteValidatorState, TypedType | Non
         result: TypedType | None = None
 
         for service_call_site in sequence_call_site.service_call_sites:
-            scoped = await self._visit_call_site(service_call_site, argument)
+            scoped = self._try_visit_visited_call_site(service_call_site, argument)
+
+            if isinstance(scoped, WirioUndefined):
+                scoped = await self._visit_call_site(service_call_site, argument)
 
             if result is None:
                 result = scoped
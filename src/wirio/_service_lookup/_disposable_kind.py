@@ -0,0 +1,37 @@
+from enum import Enum, auto
+from typing import Final
+from weakref import WeakKeyDictionary
+
+
+class DisposableKind(Enum):
+    NONE = auto()
+    SYNC = auto()
+    ASYNC = auto()
+
+    @classmethod
+    def from_instance(cls, instance: object) -> "DisposableKind":
+        """Get how the instance must be entered and disposed, probing its type only once."""
+        instance_type = type(instance)
+        disposable_kind = _disposable_kinds_by_type.get(instance_type)
+
+        if disposable_kind is None:
+            disposable_kind = cls._from_type(instance_type)
+            _disposable_kinds_by_type[instance_type] = disposable_kind
+
+        return disposable_kind
+
+    @classmethod
+    def _from_type(cls, type_: type) -> "DisposableKind":
+        if hasattr(type_, "__aenter__") and hasattr(type_, "__aexit__"):
+            return cls.ASYNC
+
+        if hasattr(type_, "__enter__") and hasattr(type_, "__exit__"):
+            return cls.SYNC
+
+        return cls.NONE
+
+
+# Weak keys let classes created at runtime (e.g. one per Mock instance) be collected
+_disposable_kinds_by_type: Final[WeakKeyDictionary[type, DisposableKind]] = (
+    WeakKeyDictionary()
+)
@@ -0,0 +1,78 @@
+import typing
+from collections.abc import AsyncGenerator, Callable, Generator
+from typing import Any, Final, final
+from weakref import WeakKeyDictionary
+
+from wirio._service_lookup._implementation_factory_kind import (
+    ImplementationFactoryKind,
+)
+
+
+@final
+class ImplementationFactoryInformation:
+    __slots__ = ("_kind", "_return_type")
+
+    _kind: Final[ImplementationFactoryKind]
+    _return_type: type | None
+
+    def __init__(self, implementation_factory: Callable[..., Any]) -> None:
+        # The implementation factory isn't kept, as it's the weak key this information is cached under
+        self._kind = ImplementationFactoryKind.from_implementation_factory(
+            implementation_factory
+        )
+        self._return_type = None
+
+    @classmethod
+    def from_implementation_factory(
+        cls, implementation_factory: Callable[..., Any]
+    ) -> "ImplementationFactoryInformation":
+        """Get the information of the implementation factory, inspecting it only once."""
+        try:
+            implementation_factory_information = (
+                _implementation_factory_informations.get(implementation_factory)
+            )
+        except TypeError:
+            # The implementation factory can't be weakly referenced, so it can't be cached
+            return cls(implementation_factory)
+
+        if implementation_factory_information is None:
+            implementation_factory_information = cls(implementation_factory)
+            _implementation_factory_informations[implementation_factory] = (
+                implementation_factory_information
+            )
+
+        return implementation_factory_information
+
+    @property
+    def kind(self) -> ImplementationFactoryKind:
+        return self._kind
+
+    def get_return_type(self, implementation_factory: Callable[..., Any]) -> type:
+        """Get the type returned by the implementation factory, or yielded if it's a generator."""
+        # Only factories registered without a service type need it, so the type hints are evaluated on first use
+        if self._return_type is None:
+            self._return_type = self._get_return_type(implementation_factory)
+
+        return self._return_type
+
+    def _get_return_type(self, implementation_factory: Callable[..., Any]) -> type:
+        type_hints: dict[str, type] = typing.get_type_hints(implementation_factory)
+        return_type = type_hints.get("return")
+
+        if return_type is None:
+            error_message = "Missing return type hints from 'implementation_factory'"
+            raise ValueError(error_message)
+
+        return_type_origin = typing.get_origin(return_type)
+
+        if return_type_origin in (Generator, AsyncGenerator):
+            return_type_arguments = typing.get_args(return_type)
+            return return_type_arguments[0]
+
+        return return_type
+
+
+# Weak keys, so factories defined inside functions (e.g. per test) don't outlive their registrations
+_implementation_factory_informations: Final[
+    WeakKeyDictionary[Callable[..., Any], ImplementationFactoryInformation]
+] = WeakKeyDictionary()
@@ -0,0 +1,26 @@
+import inspect
+from collections.abc import Callable
+from enum import Enum, auto
+from typing import Any
+
+
+class ImplementationFactoryKind(Enum):
+    SYNC = auto()
+    ASYNC = auto()
+    SYNC_GENERATOR = auto()
+    ASYNC_GENERATOR = auto()
+
+    @classmethod
+    def from_implementation_factory(
+        cls, implementation_factory: Callable[..., Any]
+    ) -> "ImplementationFactoryKind":
+        if inspect.isasyncgenfunction(implementation_factory):
+            return cls.ASYNC_GENERATOR
+
+        if inspect.isgeneratorfunction(implementation_factory):
+            return cls.SYNC_GENERATOR
+
+        if inspect.iscoroutinefunction(implementation_factory):
+            return cls.ASYNC
+
+        return cls.SYNC
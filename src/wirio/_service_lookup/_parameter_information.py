@@ -10,56 +10,67 @@ from wirio.annotations import Injectable
 
 @final
 class ParameterInformation:
-    _parameter_type: TypedType
-    _is_optional: bool
-    _has_default_value: bool
-    _default_value: object | None
+    _parameter_type: Final[TypedType]
+    _is_optional: Final[bool]
+    _has_default_value: Final[bool]
+    _default_value: Final[object | None]
     _injectable_dependency: Final[Injectable | None]
 
     def __init__(self, parameter: Parameter) -> None:
-        if parameter.annotation is Parameter.empty:
+        annotation = parameter.annotation
+
+        if annotation is Parameter.empty:
             error_message = (
                 f"The parameter '{parameter.name}' must have a type annotation"
             )
             raise RuntimeError(error_message)
 
-        self._is_optional = False
-        self._has_default_value = False
-        self._default_value = None
-        self._injectable_dependency = None
-        origin = typing.get_origin(parameter.annotation)
-        args = typing.get_args(parameter.annotation)
+        # Compute everything in locals and assign the attributes once at the end
+        is_optional = False
+        has_default_value = False
+        default_value: object | None = None
+        injectable_dependency: Injectable | None = None
+        origin = typing.get_origin(annotation)
+        args = typing.get_args(annotation)
 
         if origin is Annotated:
-            parameter_type = args[0]
-            self._has_default_value = True
+            annotated_type = args[0]
+            has_default_value = True
 
             if callable(args[1]):
-                self._default_value = args[1]()
+                default_value = args[1]()
             else:
                 injectable_dependency = ParamUtils.get_injectable_dependency(parameter)
 
                 if injectable_dependency is not None:
-                    self._has_default_value = False
-                    self._injectable_dependency = injectable_dependency
+                    has_default_value = False
                 else:
-                    self._default_value = args[1]
-
-            origin = typing.get_origin(parameter_type)
+                    default_value = args[1]
 
-            if self._is_origin_a_union(origin):
-                args = typing.get_args(parameter_type)
-                self._extract_from_union(parameter, args)
+            if self._is_origin_a_union(typing.get_origin(annotated_type)):
+                parameter_type = self._extract_from_union(
+                    parameter, typing.get_args(annotated_type)
+                )
+                is_optional = True
             else:
-                self._parameter_type = TypedType.from_type(parameter_type)
+                parameter_type = TypedType.from_type(annotated_type)
         elif self._is_origin_a_union(origin):
-            self._extract_from_union(parameter, args)
+            parameter_type = self._extract_from_union(parameter, args)
+            is_optional = True
         else:
-            self._parameter_type = TypedType.from_type(parameter.annotation)
+            parameter_type = TypedType.from_type(annotation)
+
+        if (is_optional or origin is not Annotated) and (
+            parameter.default is not Parameter.empty
+        ):
+            has_default_value = True
+            default_value = parameter.default
 
-            if parameter.default is not Parameter.empty:
-                self._has_default_value = True
-                self._default_value = parameter.default
+        self._parameter_type = parameter_type
+        self._is_optional = is_optional
+        self._has_default_value = has_default_value
+        self._default_value = default_value
+        self._injectable_dependency = injectable_dependency
 
     @property
     def parameter_type(self) -> TypedType:
@@ -84,7 +95,9 @@ class ParameterInformation:
     def _is_origin_a_union(self, origin: type) -> bool:
         return origin is Union or origin is UnionType
 
-    def _extract_from_union(self, parameter: Parameter, args: tuple[Any, ...]) -> None:
+    def _extract_from_union(
+        self, parameter: Parameter, args: tuple[Any, ...]
+    ) -> TypedType:
         length_of_a_union_of_a_type_and_none = 2  # Example: int | None
 
         if len(args) > length_of_a_union_of_a_type_and_none:
@@ -99,12 +112,4 @@ class ParameterInformation:
 
         # At this point, we know that the Union has exactly one type plus None
         # The type that is not None is the actual parameter type
-        self._parameter_type = TypedType.from_type(
-            next(arg for arg in args if arg is not type(None))
-        )
-
-        self._is_optional = True
-
-        if parameter.default is not Parameter.empty:
-            self._has_default_value = True
-            self._default_value = parameter.default
+        return TypedType.from_type(next(arg for arg in args if arg is not type(None)))
@@ -9,8 +9,11 @@ from wirio._service_lookup._typed_type import TypedType
 
 @final
 class SequenceCallSite(ServiceCallSite):
+    __slots__ = ("_item_type", "_service_call_sites", "_service_type")
+
     _item_type: Final[TypedType]
     _service_call_sites: Final[list[ServiceCallSite]]
+    _service_type: Final[TypedType]
 
     def __init__(
         self,
@@ -21,12 +24,15 @@ class SequenceCallSite(ServiceCallSite):
     ) -> None:
         self._item_type = item_type
         self._service_call_sites = service_call_sites
+        # Subscripting `Sequence` allocates a new generic alias, so it's done once instead of on every visit
+        self._service_type = TypedType.from_type(
+            Sequence[item_type.to_type()]  # ty: ignore[invalid-type-form]
+        )
         super().__init__(cache=result_cache, key=service_key)
 
     @property
     def service_type(self) -> TypedType:
-        type_ = self._item_type.to_type()
-        return TypedType.from_type(Sequence[type_])  # ty: ignore[invalid-type-form]
+        return self._service_type
 
     @property
     def kind(self) -> CallSiteKind:
@@ -9,6 +9,8 @@ from wirio._service_lookup._typed_type import TypedType
 class ServiceCallSite(ABC):
     """Representation of how a service must be created."""
 
+    __slots__ = ("_cache", "_key", "_lock", "_value")
+
     _cache: ResultCache
     _value: object | None
     _key: object | None
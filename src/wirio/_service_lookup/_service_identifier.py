@@ -1,4 +1,5 @@
 from collections.abc import Hashable
+from functools import lru_cache
 from typing import (
     Final,
     final,
@@ -15,10 +16,17 @@ class ServiceIdentifier(Hashable):
 
     _service_key: Final[object | None]
     _service_type: Final[TypedType]
+    _hash: Final[int]
 
     def __init__(self, service_key: object | None, service_type: TypedType) -> None:
         self._service_key = service_key
         self._service_type = service_type
+        # The identifier is immutable and used as a dictionary key on every resolution, so the hash is computed once
+        self._hash = (
+            hash(service_type)
+            if service_key is None
+            else (hash(service_type) * 397) ^ hash(service_key)
+        )
 
     @property
     def service_key(self) -> object | None:
@@ -31,6 +39,16 @@ class ServiceIdentifier(Hashable):
     @classmethod
     def from_service_type(
         cls, service_type: TypedType, service_key: object | None = None
+    ) -> "ServiceIdentifier":
+        # The arguments are passed positionally, so keyword and positional calls share the same cache entry
+        return cls._from_service_type(service_type, service_key)
+
+    # Resolving a service by type builds its identifier on every call, so identifiers are reused. Equal identifiers
+    # then usually are the same instance, and dictionary lookups can compare them by identity
+    @classmethod
+    @lru_cache(maxsize=2048)
+    def _from_service_type(
+        cls, service_type: TypedType, service_key: object | None, /
     ) -> "ServiceIdentifier":
         return cls(service_key=service_key, service_type=service_type)
 
@@ -45,16 +63,19 @@ class ServiceIdentifier(Hashable):
 
     @override
     def __hash__(self) -> int:
-        if self.service_key is None:
-            return hash(self._service_type)
-
-        return (hash(self._service_type) * 397) ^ hash(self._service_key)
+        return self._hash
 
     @override
     def __eq__(self, value: object) -> bool:
+        if self is value:
+            return True
+
         if not isinstance(value, ServiceIdentifier):
             return NotImplemented
 
+        if self._hash != value._hash:
+            return False
+
         if self.service_key is None and value.service_key is None:
             return self.service_type == value.service_type
 
@@ -2,6 +2,7 @@ import typing
 from collections.abc import (
     Hashable,
 )
+from functools import lru_cache
 from typing import Any, Final, final, override
 
 
@@ -9,26 +10,49 @@ from typing import Any, Final, final, override
 class TypedType(Hashable):
     """Version of :class:`type` that takes into account generic parameters."""
 
+    __slots__ = ("_args", "_hash", "_origin", "_representation")
+
     _origin: Final[Any]
     _args: Final[tuple[Any, ...]]
+    _hash: Final[int]
+    _representation: str | None
 
     def __init__(
         self,
         type_: Any,  # noqa: ANN401
     ) -> None:
-        origin = typing.get_origin(type_)
-        has_generics = origin is not None
-
-        if not has_generics:
+        # Plain classes are the most common case and never have generic parameters
+        if isinstance(type_, type):
             self._origin = type_
             self._args = ()
-            return
+        else:
+            origin = typing.get_origin(type_)
+            has_generics = origin is not None
 
-        self._origin = origin
-        self._args = typing.get_args(type_)
+            if has_generics:
+                self._origin = origin
+                self._args = typing.get_args(type_)
+            else:
+                self._origin = type_
+                self._args = ()
+
+        # The type is immutable and used as a dictionary key on every resolution, so the hash is computed once
+        self._hash = hash(self._origin) ^ hash(self._args)
+        self._representation = None
 
     @classmethod
     def from_type(cls, type_: type) -> "TypedType":
+        # Only plain classes are interned, as they're compared by identity. Generic aliases that compare equal can
+        # still have different arguments (e.g. `int | str` and `str | int`)
+        if not isinstance(type_, type):  # pyright: ignore[reportUnnecessaryIsInstance]
+            return cls(type_)
+
+        return cls._from_class(type_)
+
+    # Each interned instance holds its class, so the cache is bounded to let classes created at runtime be collected
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _from_class(cls, type_: type) -> "TypedType":
         return cls(type_)
 
     @classmethod
@@ -70,51 +94,59 @@ class TypedType(Hashable):
             error_message = "The current type is not a constructed generic type"
             raise RuntimeError(error_message)
 
-        return TypedType(self._origin)
+        return TypedType.from_type(self._origin)
 
     def generic_type_arguments(self) -> list["TypedType"]:
         """Get an list of the generic type arguments for this type."""
-        return [TypedType(argument) for argument in self._args]
+        return [TypedType.from_type(argument) for argument in self._args]
 
     def _create_representation(
         self,
         origin: Any,  # noqa: ANN401
         args: tuple[Any, ...],
     ) -> str:
-        args_representation = ""
-
-        if len(args) > 0:
-            for arg in args:
-                arg_origin = typing.get_origin(arg)
-                arg_args = typing.get_args(arg)
-                has_generics = arg_origin is not None
+        arg_representations: list[str] = []
 
-                if has_generics:
-                    args_representation += self._create_representation(
-                        arg_origin, arg_args
-                    )
-                else:
-                    args_representation += f"{arg.__module__}.{arg.__qualname__}"
+        for arg in args:
+            arg_origin = typing.get_origin(arg)
+            has_generics = arg_origin is not None
 
-                if arg != args[-1]:
-                    args_representation += ", "
+            if has_generics:
+                arg_representations.append(
+                    self._create_representation(arg_origin, typing.get_args(arg))
+                )
+            else:
+                arg_representations.append(f"{arg.__module__}.{arg.__qualname__}")
 
-        if len(args_representation) > 0:
-            args_representation = f"[{args_representation}]"
+        args_representation = (
+            f"[{', '.join(arg_representations)}]"
+            if len(arg_representations) > 0
+            else ""
+        )
 
         return f"{origin.__module__}.{origin.__qualname__}{args_representation}"
 
     @override
     def __repr__(self) -> str:
-        return self._create_representation(self._origin, self._args)
+        # The type is immutable, so the representation is only built once
+        if self._representation is None:
+            self._representation = self._create_representation(self._origin, self._args)
+
+        return self._representation
 
     @override
     def __hash__(self) -> int:
-        return hash(self._origin) ^ hash(self._args)
+        return self._hash
 
     @override
     def __eq__(self, value: object) -> bool:
+        if self is value:
+            return True
+
         if not isinstance(value, TypedType):
             return NotImplemented
 
-        return self._origin == value._origin and self._args == value._args
+        # Origins are usually classes, so the identity check avoids calling their `__eq__`
+        return (
+            self._origin is value._origin or self._origin == value._origin
+        ) and self._args == value._args
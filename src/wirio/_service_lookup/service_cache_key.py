@@ -10,10 +10,13 @@ from wirio._service_lookup._service_identifier import (
 class ServiceCacheKey(Hashable):
     _service_identifier: Final[ServiceIdentifier]
     _slot: Final[int]
+    _hash: Final[int]
 
     def __init__(self, service_identifier: ServiceIdentifier, slot: int) -> None:
         self._service_identifier = service_identifier
         self._slot = slot
+        # The key is immutable and used for every call site and resolved service lookup, so the hash is computed once
+        self._hash = (hash(service_identifier) * 397) ^ slot
 
     @property
     def service_identifier(self) -> ServiceIdentifier:
@@ -25,14 +28,21 @@ class ServiceCacheKey(Hashable):
 
     @override
     def __hash__(self) -> int:
-        return (hash(self._service_identifier) * 397) ^ self._slot
+        return self._hash
 
     @override
     def __eq__(self, value: object) -> bool:
+        if self is value:
+            return True
+
         if not isinstance(value, ServiceCacheKey):
             return NotImplemented
 
+        if self._hash != value._hash:
+            return False
+
+        # Compare the slot first, as it's cheaper than comparing the service identifiers
         return (
-            self._service_identifier == value.service_identifier
-            and self._slot == value.slot
+            self._slot == value._slot
+            and self._service_identifier == value._service_identifier
         )
@@ -1,3 +1,5 @@
+import importlib.util
+from functools import cache
 from typing import ClassVar, final
 
 
@@ -13,14 +15,11 @@ class ExtraDependencies:
         "'azure-keyvault-secrets', 'azure-identity' or 'aiohttp>=3.13.3' are not installed. Please, run 'uv add wirio[azure-key-vault]' to install the required dependencies"
     )
 
+    # A failed import isn't cached by Python, so checking again would go through the import machinery every time
     @staticmethod
+    @cache
     def is_fastapi_installed() -> bool:
-        try:
-            import fastapi  # pyright: ignore[reportUnusedImport] # noqa: F401, PLC0415
-        except ImportError:
-            return False
-
-        return True
+        return ExtraDependencies._are_modules_installed("fastapi")
 
     @classmethod
     def ensure_fastapi_is_installed(cls) -> None:
@@ -32,14 +31,9 @@ class ExtraDependencies:
             raise ImportError(cls.FASTAPI_NOT_INSTALLED_ERROR_MESSAGE) from error
 
     @staticmethod
+    @cache
     def is_sqlmodel_installed() -> bool:
-        try:
-            import greenlet  # pyright: ignore[reportUnusedImport] # noqa: F401, PLC0415
-            import sqlmodel  # pyright: ignore[reportUnusedImport] # noqa: F401, PLC0415
-        except ImportError:
-            return False
-
-        return True
+        return ExtraDependencies._are_modules_installed("greenlet", "sqlmodel")
 
     @classmethod
     def ensure_sqlmodel_is_installed(cls) -> None:
@@ -54,15 +48,11 @@ class ExtraDependencies:
             raise ImportError(cls.SQLMODEL_NOT_INSTALLED_ERROR_MESSAGE) from error
 
     @staticmethod
+    @cache
     def is_azure_key_vault_installed() -> bool:
-        try:
-            import aiohttp  # pyright: ignore[reportUnusedImport] # noqa: F401, PLC0415
-            import azure.core.credentials  # pyright: ignore[reportUnusedImport] # noqa: PLC0415
-            import azure.identity.aio  # pyright: ignore[reportUnusedImport] # noqa: F401, PLC0415
-        except ImportError:
-            return False
-
-        return True
+        return ExtraDependencies._are_modules_installed(
+            "aiohttp", "azure.core", "azure.identity"
+        )
 
     @classmethod
     def ensure_azure_key_vault_is_installed(cls) -> None:
@@ -74,3 +64,15 @@ class ExtraDependencies:
             raise ImportError(
                 cls.AZURE_KEY_VAULT_NOT_INSTALLED_ERROR_MESSAGE
             ) from error
+
+    @staticmethod
+    def _are_modules_installed(*module_names: str) -> bool:
+        """Check that the modules can be found, without executing them."""
+        try:
+            return all(
+                importlib.util.find_spec(module_name) is not None
+                for module_name in module_names
+            )
+        except ModuleNotFoundError:
+            # The parent package of a submodule isn't installed
+            return False
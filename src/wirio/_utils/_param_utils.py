@@ -1,4 +1,5 @@
 from collections.abc import Sequence
+from functools import lru_cache
 from inspect import Parameter
 from typing import Any
 
@@ -11,7 +12,24 @@ class ParamUtils:
         if not hasattr(parameter.annotation, "__metadata__"):
             return None
 
-        metadata = cls._get_metadata(parameter)
+        try:
+            return cls._get_cached_injectable_dependency(parameter.annotation)
+        except TypeError:
+            # The annotation metadata isn't hashable, so it can't be cached
+            return cls._get_injectable_dependency_from_annotation(parameter.annotation)
+
+    # Endpoints and constructors commonly share the same annotated types, so the metadata is only inspected once
+    @classmethod
+    @lru_cache(maxsize=2048)
+    def _get_cached_injectable_dependency(cls, annotation: Any) -> Injectable | None:  # noqa: ANN401
+        return cls._get_injectable_dependency_from_annotation(annotation)
+
+    @classmethod
+    def _get_injectable_dependency_from_annotation(
+        cls,
+        annotation: Any,  # noqa: ANN401
+    ) -> Injectable | None:
+        metadata = cls._get_metadata(annotation)
 
         if metadata is None:
             return None
@@ -32,8 +50,8 @@ class ParamUtils:
         return None
 
     @classmethod
-    def _get_metadata(cls, parameter: Parameter) -> Sequence[Any] | None:
-        if not hasattr(parameter.annotation, "__metadata__"):
+    def _get_metadata(cls, annotation: Any) -> Sequence[Any] | None:  # noqa: ANN401
+        if not hasattr(annotation, "__metadata__"):
             return None
 
-        return parameter.annotation.__metadata__
+        return annotation.__metadata__
@@ -20,6 +20,8 @@ from wirio.exceptions import (
 class BaseServiceProvider(KeyedServiceProvider, ServiceScopeFactory, ABC):
     """Define a mechanism for retrieving a service object; that is, an object that provides custom support to other objects."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def get_service_object(self, service_type: TypedType) -> object | None: ...
 
@@ -8,6 +8,8 @@ from wirio._service_lookup._typed_type import (
 class KeyedServiceProvider(ABC):
     """Retrieve services using a key and a type."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def get_keyed_service_object(
         self, service_key: object | None, service_type: TypedType
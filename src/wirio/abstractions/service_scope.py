@@ -14,6 +14,8 @@ class ServiceScope(AbstractAsyncContextManager["ServiceScope"], ABC):
     services that have been resolved from ServiceProvider will be disposed.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def service_provider(self) -> BaseServiceProvider:
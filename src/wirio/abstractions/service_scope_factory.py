@@ -8,6 +8,8 @@ if TYPE_CHECKING:
 class ServiceScopeFactory(ABC):
     """Create instances of :class:`ServiceScope`, which is used to create services within a scope."""
 
+    __slots__ = ()
+
     @abstractmethod
     def create_scope(self) -> "ServiceScope":
         """Create a :class:`ServiceScope` that contains a :class:`ServiceProvider` used to resolve dependencies from a newly created scope."""
@@ -1,4 +1,5 @@
 import contextlib
+import functools
 import importlib
 from dataclasses import dataclass
 from typing import final, overload
@@ -30,6 +31,14 @@ class FromKeyedServicesInjectable(Injectable):
     lookup_mode: ServiceKeyLookupMode
 
 
+@functools.lru_cache(maxsize=1024)
+def _get_from_keyed_services_injectable(
+    key: object | None, lookup_mode: ServiceKeyLookupMode
+) -> FromKeyedServicesInjectable:
+    # The injectable is immutable and rebuilt on every binding (per request with FastAPI), so the same instance is reused
+    return FromKeyedServicesInjectable(key=key, lookup_mode=lookup_mode)
+
+
 def _return_injectable[TInjectable: Injectable](
     injectable: type[TInjectable],
 ) -> TInjectable:
@@ -72,8 +81,8 @@ def FromKeyedServices(  # noqa: N802
         is_key_not_provided = isinstance(key, WirioUndefined)
 
         if is_key_not_provided:
-            return FromKeyedServicesInjectable(
-                key=None, lookup_mode=ServiceKeyLookupMode.INHERIT_KEY
+            return _get_from_keyed_services_injectable(
+                None, ServiceKeyLookupMode.INHERIT_KEY
             )
 
         lookup_mode = (
@@ -81,7 +90,7 @@ def FromKeyedServices(  # noqa: N802
             if key is None
             else ServiceKeyLookupMode.EXPLICIT_KEY
         )
-        return FromKeyedServicesInjectable(key=key, lookup_mode=lookup_mode)
+        return _get_from_keyed_services_injectable(key, lookup_mode)
 
     _dependency.__is_wirio_depends__ = True  # pyright: ignore[reportFunctionMemberAccess] # ty: ignore[unresolved-attribute]
 
@@ -85,12 +85,23 @@ class ConfigurationManager(ConfigurationBuilder, ConfigurationRoot):
             asyncio.run(coroutine)
 
         try:
-            event_loop = asyncio.get_running_loop()
-            event_loop.run_until_complete(coroutine)
+            asyncio.get_running_loop()
         except RuntimeError:
-            thread = Thread(target=run_coroutine)
-            thread.start()
-            thread.join()
+            # No event loop is running in this thread, so the coroutine runs in a private loop that isn't set as the current one, unlike asyncio.run
+            event_loop = asyncio.new_event_loop()
+
+            try:
+                event_loop.run_until_complete(coroutine)
+                event_loop.run_until_complete(event_loop.shutdown_asyncgens())
+            finally:
+                event_loop.close()
+
+            return
+
+        # The running event loop can't be blocked on, so the coroutine runs in its own thread
+        thread = Thread(target=run_coroutine)
+        thread.start()
+        thread.join()
 
     @overload
     def get_required_value(self, key: str) -> str: ...
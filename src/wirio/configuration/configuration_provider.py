@@ -18,13 +18,10 @@ class ConfigurationProvider(ABC):
         return self._data
 
     async def load(self) -> None:
-        normalized_data: dict[str, str | None] = {}
-
-        for item_key, item_data in self._data.items():
-            item_key_in_snake_case = ConventionChanger.to_snake_case(item_key)
-            normalized_data[item_key_in_snake_case] = item_data
-
-        self._data = normalized_data
+        self._data = {
+            ConventionChanger.to_snake_case(item_key): item_data
+            for item_key, item_data in self._data.items()
+        }
 
     def try_get(self, key: str) -> str | None | WirioUndefined:
         return self._data.get(key, WirioUndefined.INSTANCE)
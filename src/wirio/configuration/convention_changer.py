@@ -1,36 +1,24 @@
 import re
+from functools import lru_cache
+from typing import ClassVar
 
 
 class ConventionChanger:
+    # Positions where an underscore is inserted:
+    # - Between a sequence of uppercase letters and an uppercase letter followed by a lowercase letter
+    # - Between a lowercase letter and an uppercase letter or a digit
+    # - Between a digit and an uppercase letter
+    _WORD_BOUNDARY_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r"(?<=[A-Z])(?=[A-Z][a-z])|(?<=[a-z])(?=[A-Z0-9])|(?<=[0-9])(?=[A-Z])"
+    )
+
+    # Providers commonly share key names (e.g. environment variables and JSON files), so conversions are reused
     @staticmethod
+    @lru_cache(maxsize=4096)
     def to_snake_case(string_to_convert: str) -> str:
         """Convert a PascalCase, camelCase, or kebab-case string to snake_case."""
-        # Handle the sequence of uppercase letters followed by a lowercase letter
-        converted_string = re.sub(
-            r"([A-Z]+)([A-Z][a-z])",
-            lambda match: f"{match.group(1)}_{match.group(2)}",
-            string_to_convert,
-        )
-
-        # Insert an underscore between a lowercase letter and an uppercase letter
-        converted_string = re.sub(
-            r"([a-z])([A-Z])",
-            lambda match: f"{match.group(1)}_{match.group(2)}",
-            converted_string,
-        )
-
-        # Insert an underscore between a digit and an uppercase letter
-        converted_string = re.sub(
-            r"([0-9])([A-Z])",
-            lambda match: f"{match.group(1)}_{match.group(2)}",
-            converted_string,
-        )
-
-        # Insert an underscore between a lowercase letter and a digit
-        converted_string = re.sub(
-            r"([a-z])([0-9])",
-            lambda match: f"{match.group(1)}_{match.group(2)}",
-            converted_string,
+        converted_string = ConventionChanger._WORD_BOUNDARY_PATTERN.sub(
+            "_", string_to_convert
         )
 
         # Replace hyphens with underscores to handle kebab-case
@@ -4,18 +4,45 @@ from typing import Final, final
 from wirio.hosting._environment_variable import EnvironmentVariable
 from wirio.hosting.environment import Environment
 
+# Enum member lookups go through the enum metaclass, so the values are resolved once
+_WIRIO_ENVIRONMENT_VARIABLE: Final[str] = EnvironmentVariable.WIRIO_ENVIRONMENT.value
+_LOCAL_ENVIRONMENT_NAME: Final[str] = Environment.LOCAL.value
+_DEVELOPMENT_ENVIRONMENT_NAME: Final[str] = Environment.DEVELOPMENT.value
+_STAGING_ENVIRONMENT_NAME: Final[str] = Environment.STAGING.value
+_PRODUCTION_ENVIRONMENT_NAME: Final[str] = Environment.PRODUCTION.value
+
 
 @final
 class HostEnvironment:
     """Provide information about the hosting environment an application is running in."""
 
+    __slots__ = (
+        "_content_root_path",
+        "_environment_name",
+        "_is_development",
+        "_is_local",
+        "_is_production",
+        "_is_staging",
+    )
+
     _environment_name: Final[str]
     _content_root_path: Final[str]
+    _is_local: Final[bool]
+    _is_development: Final[bool]
+    _is_staging: Final[bool]
+    _is_production: Final[bool]
 
     def __init__(self, content_root_path: str) -> None:
-        self._environment_name = self._get_current_environment_name()
+        environment_name = self._get_current_environment_name()
+        self._environment_name = environment_name
         self._content_root_path = content_root_path
 
+        # The environment name can't change, so the predicates are computed once
+        self._is_local = environment_name == _LOCAL_ENVIRONMENT_NAME
+        self._is_development = environment_name == _DEVELOPMENT_ENVIRONMENT_NAME
+        self._is_staging = environment_name == _STAGING_ENVIRONMENT_NAME
+        self._is_production = environment_name == _PRODUCTION_ENVIRONMENT_NAME
+
     @property
     def environment_name(self) -> str:
         """Environment name."""
@@ -32,21 +59,20 @@ class HostEnvironment:
 
     def is_local(self) -> bool:
         """Check if the current host environment name is `local`."""
-        return self.is_environment(Environment.LOCAL.value)
+        return self._is_local
 
     def is_development(self) -> bool:
         """Check if the current host environment name is `development`."""
-        return self.is_environment(Environment.DEVELOPMENT.value)
+        return self._is_development
 
     def is_staging(self) -> bool:
         """Check if the current host environment name is `staging`."""
-        return self.is_environment(Environment.STAGING.value)
+        return self._is_staging
 
     def is_production(self) -> bool:
         """Check if the current host environment name is `production`."""
-        return self.is_environment(Environment.PRODUCTION.value)
+        return self._is_production
 
     def _get_current_environment_name(self) -> str:
-        return os.getenv(
-            EnvironmentVariable.WIRIO_ENVIRONMENT.value, Environment.LOCAL.value
-        )
+        # Not cached at import time, so variables set after importing wirio (e.g. loaded from a .env file) are honored
+        return os.getenv(_WIRIO_ENVIRONMENT_VARIABLE, _LOCAL_ENVIRONMENT_NAME)
@@ -4,14 +4,12 @@ from collections.abc import AsyncGenerator, Callable
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
 from inspect import Parameter
-from typing import TYPE_CHECKING, Any, final
+from typing import TYPE_CHECKING, Any, Final, final
 
 from fastapi import FastAPI
 from fastapi.routing import APIRoute
-from starlette.requests import Request
 from starlette.routing import BaseRoute, Match
 from starlette.types import ASGIApp, Receive, Scope, Send
-from starlette.websockets import WebSocket
 
 from wirio._service_lookup._parameter_information import (
     ParameterInformation,
@@ -27,10 +25,12 @@ if TYPE_CHECKING:
     from wirio.service_provider import ServiceProvider
 
 
-_current_request: ContextVar[Request | WebSocket] = ContextVar(
-    "wirio_starlette_request"
+_current_service_scope: ContextVar[ServiceScope] = ContextVar(
+    "wirio_current_service_scope"
 )
 
+_INJECTABLE_SCOPE_TYPES: Final[frozenset[str]] = frozenset({"http", "websocket"})
+
 
 @final
 class FastapiDependencyInjection:
@@ -41,7 +41,7 @@ class FastapiDependencyInjection:
         cls._set_wirio_services(app, services)
         app.add_middleware(_WirioAsgiMiddleware)  # ty: ignore[invalid-argument-type]
         cls._update_lifespan(app)
-        cls._inject_routes(app.routes)
+        app.state.wirio_injected_routes = cls._inject_routes(app.routes)
 
     @classmethod
     def _update_lifespan(cls, app: FastAPI) -> None:
@@ -64,21 +64,22 @@ class FastapiDependencyInjection:
         cls, target: Callable[..., Any]
     ) -> bool:
         for parameter in inspect.signature(target).parameters.values():
-            if (
-                parameter.annotation is not None
-                and hasattr(parameter.annotation, "__metadata__")
-                and hasattr(parameter.annotation.__metadata__[0], "dependency")
-                and hasattr(
-                    parameter.annotation.__metadata__[0].dependency,
-                    "__is_wirio_depends__",
-                )
-            ):
+            metadata = getattr(parameter.annotation, "__metadata__", None)
+
+            if not metadata:
+                continue
+
+            dependency = getattr(metadata[0], "dependency", None)
+
+            if getattr(dependency, "__is_wirio_depends__", False):
                 return True
 
         return False
 
     @classmethod
-    def _inject_routes(cls, routes: list[BaseRoute]) -> None:
+    def _inject_routes(cls, routes: list[BaseRoute]) -> tuple[APIRoute, ...]:
+        injected_routes: list[APIRoute] = []
+
         for route in routes:
             if not (
                 isinstance(route, APIRoute)
@@ -91,19 +92,25 @@ class FastapiDependencyInjection:
                 continue
 
             route.dependant.call = cls._inject_from_container(route.dependant.call)
+            injected_routes.append(route)
+
+        return tuple(injected_routes)
 
     @classmethod
     def _inject_from_container(cls, target: Callable[..., Any]) -> Callable[..., Any]:
+        # The parameters to inject only depend on the signature of the endpoint, so they're computed once
+        parameters_to_inject = tuple(cls._get_parameters_to_inject(target).items())
+
         @functools.wraps(target)
         async def _inject_async_target(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
-            parameters_to_inject = cls._get_parameters_to_inject(target)
-            parameters_to_inject_resolved: dict[str, Any] = {
-                injected_parameter_name: await cls._resolve_injected_parameter(
-                    parameter_information
-                )
-                for injected_parameter_name, parameter_information in parameters_to_inject.items()
-            }
-            return await target(*args, **{**kwargs, **parameters_to_inject_resolved})
+            target_kwargs = dict(kwargs)
+
+            for injected_parameter_name, parameter_information in parameters_to_inject:
+                target_kwargs[
+                    injected_parameter_name
+                ] = await cls._resolve_injected_parameter(parameter_information)
+
+            return await target(*args, **target_kwargs)
 
         return _inject_async_target
 
@@ -114,7 +121,7 @@ class FastapiDependencyInjection:
         This is what we almost always want. It has all the information the app container has in addition
         to data specific to the current request.
         """
-        return _current_request.get().state.wirio_service_scope
+        return _current_service_scope.get()
 
     @classmethod
     def _get_parameters_to_inject(
@@ -179,41 +186,33 @@ class FastapiDependencyInjection:
 
 @final
 class _WirioAsgiMiddleware:
+    __slots__ = ("app",)
+
     def __init__(self, app: ASGIApp) -> None:
         self.app = app
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        if scope["type"] not in {"http", "websocket"}:
+        if scope["type"] not in _INJECTABLE_SCOPE_TYPES or not self._is_injected_route(
+            scope
+        ):
             return await self.app(scope, receive, send)
 
-        if scope["type"] == "http":
-            request = Request(scope, receive=receive, send=send)
-        else:
-            request = WebSocket(scope, receive, send)
-
-        token = _current_request.set(request)
+        # The scope is created here rather than in a route dependency, so it outlives the response body and background tasks
+        services: ServiceProvider = scope["app"].state.wirio_service_provider
 
-        try:
-            is_endpoint_matched = False
-            is_async_endpoint = False
+        async with services.create_scope() as service_scope:
+            token = _current_service_scope.set(service_scope)
 
-            for route in scope["app"].routes:
-                if (
-                    isinstance(route, APIRoute)
-                    and route.matches(scope)[0] == Match.FULL
-                ):
-                    is_endpoint_matched = True
-                    original = inspect.unwrap(route.dependant.call)  # pyright: ignore[reportArgumentType]
-                    is_async_endpoint = inspect.iscoroutinefunction(original)
-                    break
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                _current_service_scope.reset(token)
 
-            if not is_endpoint_matched or not is_async_endpoint:
-                return await self.app(scope, receive, send)
+    def _is_injected_route(self, scope: Scope) -> bool:
+        # Only the routes injected during the setup need a service scope, so the rest of the routes aren't inspected
+        injected_routes: tuple[APIRoute, ...] = scope["app"].state.wirio_injected_routes
 
-            services: ServiceProvider = request.app.state.wirio_service_provider
+        if not injected_routes:
+            return False
 
-            async with services.create_scope() as service_scope:
-                request.state.wirio_service_scope = service_scope
-                await self.app(scope, receive, send)
-        finally:
-            _current_request.reset(token)
+        return any(route.matches(scope)[0] == Match.FULL for route in injected_routes)
@@ -1,5 +1,5 @@
 from collections.abc import AsyncGenerator
-from typing import TYPE_CHECKING, final
+from typing import TYPE_CHECKING, Any, final
 
 from sqlalchemy import Engine
 from sqlalchemy.ext.asyncio import (
@@ -18,15 +18,26 @@ if TYPE_CHECKING:
 @final
 class SqlmodelIntegration:
     @staticmethod
-    def add_async_services(
+    def add_async_services(  # noqa: PLR0913
         services: "ServiceCollection",
         connection_string: str,
         *,
         expire_on_commit: bool = False,
         autoflush: bool = True,
+        pool_size: int | None = None,
+        max_overflow: int | None = None,
+        pool_recycle: int | None = None,
+        pool_pre_ping: bool = False,
     ) -> None:
+        engine_options = SqlmodelIntegration._get_engine_options(
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+        )
+
         async def inject_sql_engine() -> AsyncGenerator[AsyncEngine]:
-            sql_engine = create_async_engine(url=connection_string)
+            sql_engine = create_async_engine(url=connection_string, **engine_options)
 
             try:
                 yield sql_engine
@@ -55,15 +66,26 @@ class SqlmodelIntegration:
         services.add_scoped(inject_sql_session)
 
     @staticmethod
-    def add_sync_services(
+    def add_sync_services(  # noqa: PLR0913
         services: "ServiceCollection",
         connection_string: str,
         *,
         expire_on_commit: bool = True,
         autoflush: bool = True,
+        pool_size: int | None = None,
+        max_overflow: int | None = None,
+        pool_recycle: int | None = None,
+        pool_pre_ping: bool = False,
     ) -> None:
+        engine_options = SqlmodelIntegration._get_engine_options(
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+        )
+
         def inject_sql_engine() -> Engine:
-            return create_engine(url=connection_string)
+            return create_engine(url=connection_string, **engine_options)
 
         services.add_singleton(inject_sql_engine)
 
@@ -85,3 +107,25 @@ class SqlmodelIntegration:
             return sql_session_maker()
 
         services.add_scoped(inject_sql_session)
+
+    @staticmethod
+    def _get_engine_options(
+        *,
+        pool_size: int | None,
+        max_overflow: int | None,
+        pool_recycle: int | None,
+        pool_pre_ping: bool,
+    ) -> dict[str, Any]:
+        # Unset options are omitted, so dialects whose pool doesn't accept them (e.g. SQLite) keep working
+        engine_options: dict[str, Any] = {"pool_pre_ping": pool_pre_ping}
+
+        if pool_size is not None:
+            engine_options["pool_size"] = pool_size
+
+        if max_overflow is not None:
+            engine_options["max_overflow"] = max_overflow
+
+        if pool_recycle is not None:
+            engine_options["pool_recycle"] = pool_recycle
+
+        return engine_options
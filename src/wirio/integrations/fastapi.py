@@ -5,7 +5,7 @@ from wirio.service_provider import ServiceProvider
 
 
 def get_service_provider(app: FastAPI) -> ServiceProvider:
-    assert isinstance(app.state.wirio_service_provider, ServiceProvider)
+    # Only the integration lifespan sets the service provider, so it's always a ServiceProvider
     return app.state.wirio_service_provider
 
 
@@ -1,10 +1,17 @@
+from __future__ import annotations
+
 import inspect
 import sys
 import typing
-from collections.abc import AsyncGenerator, Awaitable, Callable, Generator, Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Final, cast, overload
 
+from wirio._service_lookup._implementation_factory_information import (
+    ImplementationFactoryInformation,
+)
+from wirio._service_lookup._implementation_factory_kind import (
+    ImplementationFactoryKind,
+)
 from wirio._service_lookup._typed_type import TypedType
 from wirio._utils._extra_dependencies import ExtraDependencies
 from wirio.configuration.configuration_manager import ConfigurationManager
@@ -19,6 +26,14 @@ from wirio.service_provider import ServiceProvider
 from wirio.wirio_undefined import WirioUndefined
 
 if TYPE_CHECKING:
+    from collections.abc import (
+        AsyncGenerator,
+        Awaitable,
+        Callable,
+        Generator,
+        Iterator,
+    )
+
     from fastapi import FastAPI
 
     from wirio.integrations._fastapi_dependency_injection import (
@@ -26,7 +41,6 @@ if TYPE_CHECKING:
     )
     from wirio.integrations._sqlmodel_integration import SqlmodelIntegration
 else:
-    FastAPI = Any
     FastapiDependencyInjection = Any
     SqlmodelIntegration = Any
 
@@ -159,9 +173,9 @@ class ServiceCollection:
     ) -> None:
         """Add a transient service."""
         self._add_from_overloaded_constructor(
-            lifetime=ServiceLifetime.TRANSIENT,
-            service_type_or_implementation_factory=service_type_or_implementation_factory,
-            implementation_factory_or_implementation_type_or_implementation_instance_or_none=implementation_factory_or_implementation_type_or_none,
+            ServiceLifetime.TRANSIENT,
+            service_type_or_implementation_factory,
+            implementation_factory_or_implementation_type_or_none,
         )
 
     @overload
@@ -261,9 +275,9 @@ class ServiceCollection:
     ) -> None:
         """Add a singleton service."""
         self._add_from_overloaded_constructor(
-            lifetime=ServiceLifetime.SINGLETON,
-            service_type_or_implementation_factory=service_type_or_implementation_factory,
-            implementation_factory_or_implementation_type_or_implementation_instance_or_none=implementation_factory_or_implementation_type_or_implementation_instance_or_none,
+            ServiceLifetime.SINGLETON,
+            service_type_or_implementation_factory,
+            implementation_factory_or_implementation_type_or_implementation_instance_or_none,
         )
 
     @overload
@@ -356,9 +370,9 @@ class ServiceCollection:
     ) -> None:
         """Add a scoped service."""
         self._add_from_overloaded_constructor(
-            lifetime=ServiceLifetime.SCOPED,
-            service_type_or_implementation_factory=service_type_or_implementation_factory,
-            implementation_factory_or_implementation_type_or_implementation_instance_or_none=implementation_factory_or_implementation_type_or_none,
+            ServiceLifetime.SCOPED,
+            service_type_or_implementation_factory,
+            implementation_factory_or_implementation_type_or_none,
         )
 
     @overload
@@ -478,9 +492,9 @@ class ServiceCollection:
     ) -> None:
         """Add a keyed transient service."""
         self._add_from_overloaded_constructor(
-            lifetime=ServiceLifetime.TRANSIENT,
-            service_type_or_implementation_factory=service_type_or_implementation_factory,
-            implementation_factory_or_implementation_type_or_implementation_instance_or_none=implementation_factory_or_implementation_type_or_none,
+            ServiceLifetime.TRANSIENT,
+            service_type_or_implementation_factory,
+            implementation_factory_or_implementation_type_or_none,
             service_key=service_key,
         )
 
@@ -611,9 +625,9 @@ class ServiceCollection:
     ) -> None:
         """Add a keyed singleton service."""
         self._add_from_overloaded_constructor(
-            lifetime=ServiceLifetime.SINGLETON,
-            service_type_or_implementation_factory=service_type_or_implementation_factory,
-            implementation_factory_or_implementation_type_or_implementation_instance_or_none=implementation_factory_or_implementation_type_or_implementation_instance_or_none,
+            ServiceLifetime.SINGLETON,
+            service_type_or_implementation_factory,
+            implementation_factory_or_implementation_type_or_implementation_instance_or_none,
             service_key=service_key,
         )
 
@@ -734,9 +748,9 @@ class ServiceCollection:
     ) -> None:
         """Add a keyed scoped service."""
         self._add_from_overloaded_constructor(
-            lifetime=ServiceLifetime.SCOPED,
-            service_type_or_implementation_factory=service_type_or_implementation_factory,
-            implementation_factory_or_implementation_type_or_implementation_instance_or_none=implementation_factory_or_implementation_type_or_none,
+            ServiceLifetime.SCOPED,
+            service_type_or_implementation_factory,
+            implementation_factory_or_implementation_type_or_none,
             service_key=service_key,
         )
 
@@ -844,9 +858,9 @@ class ServiceCollection:
         An auto-activated singleton service is instantiated when the service provider is built (eagerly), rather than when it's first requested (lazily).
         """
         self._add_from_overloaded_constructor(
-            lifetime=ServiceLifetime.SINGLETON,
-            service_type_or_implementation_factory=service_type_or_implementation_factory,
-            implementation_factory_or_implementation_type_or_implementation_instance_or_none=implementation_factory_or_implementation_type_or_implementation_instance_or_none,
+            ServiceLifetime.SINGLETON,
+            service_type_or_implementation_factory,
+            implementation_factory_or_implementation_type_or_implementation_instance_or_none,
             auto_activate=True,
         )
 
@@ -980,9 +994,9 @@ class ServiceCollection:
         An auto-activated keyed singleton service is instantiated when the service provider is built (eagerly), rather than when it's first requested (lazily).
         """
         self._add_from_overloaded_constructor(
-            lifetime=ServiceLifetime.SINGLETON,
-            service_type_or_implementation_factory=service_type_or_implementation_factory,
-            implementation_factory_or_implementation_type_or_implementation_instance_or_none=implementation_factory_or_implementation_type_or_implementation_instance_or_none,
+            ServiceLifetime.SINGLETON,
+            service_type_or_implementation_factory,
+            implementation_factory_or_implementation_type_or_implementation_instance_or_none,
             service_key=service_key,
             auto_activate=True,
         )
@@ -1041,15 +1055,45 @@ class ServiceCollection:
 
         FastapiDependencyInjection.setup(app, self)
 
-    def add_sqlmodel(self, connection_string: str) -> None:
+    def add_sqlmodel(
+        self,
+        connection_string: str,
+        *,
+        pool_size: int | None = None,
+        max_overflow: int | None = None,
+        pool_recycle: int | None = None,
+        pool_pre_ping: bool = False,
+    ) -> None:
         """Add asynchronous SQLModel services."""
         self._ensure_sqlmodel_is_installed()
-        SqlmodelIntegration.add_async_services(self, connection_string)
+        SqlmodelIntegration.add_async_services(
+            self,
+            connection_string,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+        )
 
-    def add_sync_sqlmodel(self, connection_string: str) -> None:
+    def add_sync_sqlmodel(
+        self,
+        connection_string: str,
+        *,
+        pool_size: int | None = None,
+        max_overflow: int | None = None,
+        pool_recycle: int | None = None,
+        pool_pre_ping: bool = False,
+    ) -> None:
         """Add synchronous SQLModel services."""
         self._ensure_sqlmodel_is_installed()
-        SqlmodelIntegration.add_sync_services(self, connection_string)
+        SqlmodelIntegration.add_sync_services(
+            self,
+            connection_string,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+        )
 
     def _add_from_overloaded_constructor[TService](
         self,
@@ -1068,9 +1112,28 @@ class ServiceCollection:
         | type
         | object
         | None = None,
+        /,
+        *,
         service_key: object | None = WirioUndefined.INSTANCE,
         auto_activate: bool = False,
     ) -> None:
+        # Registering a class as its own implementation is the most common case, so it skips the classification below
+        if (
+            implementation_factory_or_implementation_type_or_implementation_instance_or_none
+            is None
+            and isinstance(service_type_or_implementation_factory, type)
+        ):
+            self._add(
+                lifetime=lifetime,
+                service_type=service_type_or_implementation_factory,
+                implementation_factory=None,
+                implementation_type=None,
+                implementation_instance=None,
+                service_key=service_key,
+                auto_activate=auto_activate,
+            )
+            return
+
         service_type_to_add: type[TService] | None = None
         implementation_factory_to_add: (
             Callable[..., AsyncGenerator[TService]]
@@ -1137,12 +1200,24 @@ class ServiceCollection:
         service_key: object | None,
         auto_activate: bool,
     ) -> None:
+        implementation_factory_information = (
+            ImplementationFactoryInformation.from_implementation_factory(
+                implementation_factory
+            )
+            if implementation_factory is not None
+            else None
+        )
         provided_service_type = self._get_provided_service_type(
-            service_type, implementation_factory
+            service_type, implementation_factory, implementation_factory_information
         )
         is_service_key_provided = service_key is not WirioUndefined.INSTANCE
         service_key_to_add = service_key if is_service_key_provided else None
         service_descriptor: ServiceDescriptor | None = None
+        implementation_factory_kind = (
+            implementation_factory_information.kind
+            if implementation_factory_information is not None
+            else None
+        )
 
         if implementation_instance is not None:
             service_descriptor = ServiceDescriptor.from_implementation_instance(
@@ -1174,12 +1249,16 @@ class ServiceCollection:
                 lifetime=lifetime,
                 auto_activate=auto_activate,
             )
-        elif inspect.isasyncgenfunction(implementation_factory):
+        elif implementation_factory_kind is ImplementationFactoryKind.ASYNC_GENERATOR:
+            async_generator_implementation_factory = cast(
+                "Callable[..., AsyncGenerator[TService]]", implementation_factory
+            )
+
             if is_service_key_provided:
                 service_descriptor = (
                     ServiceDescriptor.from_keyed_async_generator_implementation_factory(
                         service_type=provided_service_type,
-                        implementation_factory=implementation_factory,
+                        implementation_factory=async_generator_implementation_factory,
                         service_key=service_key_to_add,
                         lifetime=lifetime,
                         auto_activate=auto_activate,
@@ -1189,17 +1268,21 @@ class ServiceCollection:
                 service_descriptor = (
                     ServiceDescriptor.from_async_generator_implementation_factory(
                         service_type=provided_service_type,
-                        implementation_factory=implementation_factory,
+                        implementation_factory=async_generator_implementation_factory,
                         lifetime=lifetime,
                         auto_activate=auto_activate,
                     )
                 )
-        elif inspect.isgeneratorfunction(implementation_factory):
+        elif implementation_factory_kind is ImplementationFactoryKind.SYNC_GENERATOR:
+            sync_generator_implementation_factory = cast(
+                "Callable[..., Generator[TService]]", implementation_factory
+            )
+
             if is_service_key_provided:
                 service_descriptor = (
                     ServiceDescriptor.from_keyed_sync_generator_implementation_factory(
                         service_type=provided_service_type,
-                        implementation_factory=implementation_factory,
+                        implementation_factory=sync_generator_implementation_factory,
                         service_key=service_key_to_add,
                         lifetime=lifetime,
                         auto_activate=auto_activate,
@@ -1209,17 +1292,21 @@ class ServiceCollection:
                 service_descriptor = (
                     ServiceDescriptor.from_sync_generator_implementation_factory(
                         service_type=provided_service_type,
-                        implementation_factory=implementation_factory,
+                        implementation_factory=sync_generator_implementation_factory,
                         lifetime=lifetime,
                         auto_activate=auto_activate,
                     )
                 )
-        elif inspect.iscoroutinefunction(implementation_factory):
+        elif implementation_factory_kind is ImplementationFactoryKind.ASYNC:
+            async_implementation_factory = cast(
+                "Callable[..., Awaitable[TService]]", implementation_factory
+            )
+
             if is_service_key_provided:
                 service_descriptor = (
                     ServiceDescriptor.from_keyed_async_implementation_factory(
                         service_type=provided_service_type,
-                        implementation_factory=implementation_factory,
+                        implementation_factory=async_implementation_factory,
                         service_key=service_key_to_add,
                         lifetime=lifetime,
                         auto_activate=auto_activate,
@@ -1229,7 +1316,7 @@ class ServiceCollection:
                 service_descriptor = (
                     ServiceDescriptor.from_async_implementation_factory(
                         service_type=provided_service_type,
-                        implementation_factory=implementation_factory,
+                        implementation_factory=async_implementation_factory,
                         lifetime=lifetime,
                         auto_activate=auto_activate,
                     )
@@ -1265,32 +1352,22 @@ class ServiceCollection:
 
     def _get_provided_service_type[TService](
         self,
-        service_type: type[TService] | None = None,
+        service_type: type[TService] | None,
         implementation_factory: Callable[..., Awaitable[TService]]
         | Callable[..., TService]
         | Callable[..., Generator[TService]]
         | Callable[..., AsyncGenerator[TService]]
-        | None = None,
+        | None,
+        implementation_factory_information: ImplementationFactoryInformation | None,
     ) -> type:
         if service_type is not None:
             return service_type
 
         assert implementation_factory is not None
-
-        type_hints: dict[str, type] = typing.get_type_hints(implementation_factory)
-        return_type = type_hints.get("return")
-
-        if return_type is None:
-            error_message = "Missing return type hints from 'implementation_factory'"
-            raise ValueError(error_message)
-
-        return_type_origin = typing.get_origin(return_type)
-
-        if return_type_origin in (Generator, AsyncGenerator):
-            return_type_arguments = typing.get_args(return_type)
-            return return_type_arguments[0]
-
-        return return_type
+        assert implementation_factory_information is not None
+        return implementation_factory_information.get_return_type(
+            implementation_factory
+        )
 
     def _ensure_sqlmodel_is_installed(self) -> None:
         ExtraDependencies.ensure_sqlmodel_is_installed()
@@ -10,6 +10,19 @@ from wirio.service_lifetime import ServiceLifetime
 class ServiceDescriptor:
     """Service registration."""
 
+    __slots__ = (
+        "_async_generator_implementation_factory",
+        "_async_implementation_factory",
+        "_auto_activate",
+        "_implementation_instance",
+        "_implementation_type",
+        "_lifetime",
+        "_service_key",
+        "_service_type",
+        "_sync_generator_implementation_factory",
+        "_sync_implementation_factory",
+    )
+
     _service_type: Final[TypedType]
     _lifetime: Final[ServiceLifetime]
     _implementation_type: TypedType | None
@@ -321,25 +321,25 @@ class ServiceProvider(
             )
 
             for service_identifier in service_identifiers:
-                await self._service_accessors.try_remove(service_identifier)
+                self._service_accessors.try_remove(service_identifier)
 
             self._invalid_service_accessor_types.remove(service_type)
 
     def _get_engine(self) -> ServiceProviderEngine:
         return RuntimeServiceProviderEngine.INSTANCE
 
-    async def _add_built_in_services(self) -> None:
+    def _add_built_in_services(self) -> None:
         """Add built-in services that aren't part of the list of service descriptors."""
         if self._is_aenter_executed:
             return
 
-        await self._call_site_factory.add(
+        self._call_site_factory.add(
             ServiceIdentifier.from_service_type(
                 TypedType.from_type(BaseServiceProvider)
             ),
             ServiceProviderCallSite(),
         )
-        await self._call_site_factory.add(
+        self._call_site_factory.add(
             ServiceIdentifier.from_service_type(
                 TypedType.from_type(ServiceScopeFactory)
             ),
@@ -348,7 +348,7 @@ class ServiceProvider(
                 self._root,
             ),
         )
-        await self._call_site_factory.add(
+        self._call_site_factory.add(
             ServiceIdentifier.from_service_type(
                 TypedType.from_type(ServiceProviderIsService)
             ),
@@ -356,7 +356,7 @@ class ServiceProvider(
                 TypedType.from_type(ServiceProviderIsService), self._call_site_factory
             ),
         )
-        await self._call_site_factory.add(
+        self._call_site_factory.add(
             ServiceIdentifier.from_service_type(
                 TypedType.from_type(ServiceProviderIsKeyedService)
             ),
@@ -407,7 +407,7 @@ class ServiceProvider(
 
     @override
     async def __aenter__(self) -> Self:
-        await self._add_built_in_services()
+        self._add_built_in_services()
         await self._activate_auto_activated_singletons()
         await self._validate_services()
         self._descriptors.extend(self._pending_descriptors)
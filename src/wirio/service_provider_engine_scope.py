@@ -1,18 +1,13 @@
 from types import TracebackType
-from typing import TYPE_CHECKING, Final, Self, final, override
+from typing import TYPE_CHECKING, Final, Self, cast, final, override
 
 from wirio._service_lookup._asyncio_reentrant_lock import (
     AsyncioReentrantLock,
 )
+from wirio._service_lookup._disposable_kind import DisposableKind
 from wirio._service_lookup._service_identifier import (
     ServiceIdentifier,
 )
-from wirio._service_lookup._supports_async_context_manager import (
-    SupportsAsyncContextManager,
-)
-from wirio._service_lookup._supports_sync_context_manager import (
-    SupportsSyncContextManager,
-)
 from wirio._service_lookup._typed_type import TypedType
 from wirio._service_lookup.service_cache_key import ServiceCacheKey
 from wirio.abstractions.base_service_provider import BaseServiceProvider
@@ -20,6 +15,12 @@ from wirio.abstractions.service_scope import ServiceScope
 from wirio.exceptions import ObjectDisposedError
 
 if TYPE_CHECKING:
+    from wirio._service_lookup._supports_async_context_manager import (
+        SupportsAsyncContextManager,
+    )
+    from wirio._service_lookup._supports_sync_context_manager import (
+        SupportsSyncContextManager,
+    )
     from wirio.service_provider import ServiceProvider
 
 
@@ -27,14 +28,28 @@ if TYPE_CHECKING:
 class ServiceProviderEngineScope(BaseServiceProvider, ServiceScope):
     """Container resolving services with scope."""
 
+    # A scope is created per request, so avoid the per-instance `__dict__`
+    __slots__ = (
+        "_disposable_kinds",
+        "_disposables",
+        "_is_disposed",
+        "_is_root_scope",
+        "_resolved_services",
+        "_resolved_services_lock",
+        "_root_provider",
+    )
+
     _root_provider: Final["ServiceProvider"]
     _is_root_scope: Final[bool]
     _is_disposed: bool
+    # Disposables and their kinds are kept in parallel lists, so disposing doesn't need to inspect the services again
     _disposables: list[object] | None
+    _disposable_kinds: list[DisposableKind] | None
     _resolved_services: Final[dict[ServiceCacheKey, object | None]]
 
-    # A reentrant lock is needed when the lifetime is scoped and the service has a context manager
-    _resolved_services_lock: Final[AsyncioReentrantLock]
+    # A reentrant lock is needed when the lifetime is scoped and the service has a context manager.
+    # It's created on first use because many short-lived scopes never need it
+    _resolved_services_lock: AsyncioReentrantLock | None
 
     def __init__(
         self, service_provider: "ServiceProvider", is_root_scope: bool
@@ -43,8 +58,9 @@ class ServiceProviderEngineScope(BaseServiceProvider, ServiceScope):
         self._is_root_scope = is_root_scope
         self._is_disposed = False
         self._disposables = None
+        self._disposable_kinds = None
         self._resolved_services = {}
-        self._resolved_services_lock = AsyncioReentrantLock()
+        self._resolved_services_lock = None
 
     @property
     def root_provider(self) -> "ServiceProvider":
@@ -66,6 +82,9 @@ class ServiceProviderEngineScope(BaseServiceProvider, ServiceScope):
 
         For other scopes, it protects :attr:`resolved_services` and the list of disposables.
         """
+        if self._resolved_services_lock is None:
+            self._resolved_services_lock = AsyncioReentrantLock()
+
         return self._resolved_services_lock
 
     @property
@@ -102,44 +121,62 @@ class ServiceProviderEngineScope(BaseServiceProvider, ServiceScope):
         )
 
     async def capture_disposable(self, service: object | None) -> object | None:
-        if service is self or not (
-            isinstance(
-                service, (SupportsAsyncContextManager, SupportsSyncContextManager)
-            )
-        ):
+        # `None` is common for optional dependencies, and checking it is cheaper than the protocol checks
+        if service is None:
+            return None
+
+        if service is self:
+            return service
+
+        disposable_kind = DisposableKind.from_instance(service)
+
+        if disposable_kind is DisposableKind.NONE:
             return service
 
         is_disposed = False
 
-        async with self._resolved_services_lock:
+        async with self.resolved_services_lock:
             if self._is_disposed:
                 is_disposed = True
             else:
-                if self._disposables is None:
+                if self._disposables is None or self._disposable_kinds is None:
                     self._disposables = []
+                    self._disposable_kinds = []
 
                 self._disposables.append(service)
+                self._disposable_kinds.append(disposable_kind)
 
         # Don't run customer code under the lock
         if is_disposed:
-            if isinstance(service, SupportsAsyncContextManager):
-                await service.__aexit__(None, None, None)
+            if disposable_kind is DisposableKind.ASYNC:
+                await cast("SupportsAsyncContextManager", service).__aexit__(
+                    None, None, None
+                )
             else:
-                service.__exit__(None, None, None)
+                cast("SupportsSyncContextManager", service).__exit__(None, None, None)
 
             raise ObjectDisposedError
 
         return service
 
-    async def _begin_dispose(self) -> list[object] | None:
-        async with self._resolved_services_lock:
-            if self._is_disposed:
-                return None
-
-            # We've transitioned to the disposed state, so future calls to
-            # :meth:`capture_disposable` will immediately dispose the object.
-            # No further changes to disposables are allowed.
+    async def _begin_dispose(
+        self,
+    ) -> tuple[list[object], list[DisposableKind]] | None:
+        if self._resolved_services_lock is None:
+            # The lock was never created, so no coroutine can be holding it
+            is_already_disposed = self._is_disposed
             self._is_disposed = True
+        else:
+            async with self._resolved_services_lock:
+                is_already_disposed = self._is_disposed
+                self._is_disposed = True
+
+        if is_already_disposed:
+            return None
+
+        # We've transitioned to the disposed state, so future calls to
+        # :meth:`capture_disposable` will immediately dispose the object.
+        # No further changes to disposables are allowed.
 
         if self._is_root_scope and not self._root_provider.is_disposed:
             # If this :class:`ServiceProviderEngineScope` instance is a root scope, disposing this instance will need to dispose the :attr:`root_provider` too.
@@ -150,7 +187,10 @@ class ServiceProviderEngineScope(BaseServiceProvider, ServiceScope):
         # :attr:`_resolved_services` is never cleared for singletons because there might be a compilation running in background
         # trying to get a cached singleton service. If it doesn't find it
         # it will try to create a new one which will result in an :class:`ObjectDisposedError`.
-        return self._disposables
+        if self._disposables is None or self._disposable_kinds is None:
+            return None
+
+        return self._disposables, self._disposable_kinds
 
     @override
     async def __aenter__(self) -> Self:
@@ -171,10 +211,14 @@ class ServiceProviderEngineScope(BaseServiceProvider, ServiceScope):
         if to_dispose is None:
             return None
 
-        for i in range(len(to_dispose) - 1, -1, -1):
-            service = to_dispose[i]
+        services, disposable_kinds = to_dispose
 
-            if isinstance(service, SupportsAsyncContextManager):
-                await service.__aexit__(None, None, None)
-            elif isinstance(service, SupportsSyncContextManager):
-                service.__exit__(None, None, None)
+        for service, disposable_kind in zip(
+            reversed(services), reversed(disposable_kinds), strict=True
+        ):
+            if disposable_kind is DisposableKind.ASYNC:
+                await cast("SupportsAsyncContextManager", service).__aexit__(
+                    None, None, None
+                )
+            else:
+                cast("SupportsSyncContextManager", service).__exit__(None, None, None)
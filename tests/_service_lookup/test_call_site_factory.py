@@ -9,6 +9,7 @@ from wirio._service_lookup._call_site_factory import (
     ServiceDescriptorCacheItem,
 )
 from wirio._service_lookup._constant_call_site import ConstantCallSite
+from wirio._service_lookup._constructor_call_site import ConstructorCallSite
 from wirio._service_lookup._sequence_call_site import SequenceCallSite
 from wirio._service_lookup._service_identifier import ServiceIdentifier
 from wirio._service_lookup._typed_type import TypedType
@@ -303,19 +304,16 @@ class TestCallSiteFactory:
             auto_activate=False,
         )
 
-        cache_item = ServiceDescriptorCacheItem().add(first_descriptor)
+        cache_item = ServiceDescriptorCacheItem()
+        cache_item.add(first_descriptor)
 
         assert cache_item.last is first_descriptor
 
-        cache_item = (
-            ServiceDescriptorCacheItem().add(first_descriptor).add(second_descriptor)
-        )
+        cache_item.add(second_descriptor)
 
         assert cache_item.last is second_descriptor
 
-    def test_keep_previous_cache_item_immutable_when_adding_new_descriptor(
-        self,
-    ) -> None:
+    def test_keep_registration_order_when_adding_descriptors(self) -> None:
         first_descriptor = ServiceDescriptor.from_implementation_type(
             service_type=ServiceWithNoDependencies,
             implementation_type=ServiceWithNoDependencies,
@@ -337,19 +335,19 @@ class TestCallSiteFactory:
             lifetime=ServiceLifetime.TRANSIENT,
             auto_activate=False,
         )
-        previous_cache_item = (
-            ServiceDescriptorCacheItem()
-            .add(first_descriptor)
-            .add(second_descriptor)
-            .add(third_descriptor)
-        )
+        cache_item = ServiceDescriptorCacheItem()
+        cache_item.add(first_descriptor)
+        cache_item.add(second_descriptor)
+        cache_item.add(third_descriptor)
 
-        assert previous_cache_item.last is third_descriptor
-        assert list(previous_cache_item) == [
+        assert cache_item.last is third_descriptor
+        assert list(cache_item) == [
             first_descriptor,
             second_descriptor,
             third_descriptor,
         ]
+        assert cache_item.get_slot(third_descriptor) == 0
+        assert cache_item.get_slot(first_descriptor) == len(cache_item) - 1
 
     async def test_fail_when_resolving_service_descriptor_without_registration_strategy(
         self,
@@ -377,3 +375,71 @@ class TestCallSiteFactory:
         cache_item = ServiceDescriptorCacheItem()
 
         assert list(cache_item) == []
+
+    async def test_reuse_constructor_information_when_implementation_type_is_registered_several_times(
+        self,
+    ) -> None:
+        first_descriptor = ServiceDescriptor.from_implementation_type(
+            service_type=ServiceWithNoDependencies,
+            implementation_type=ServiceWithNoDependencies,
+            service_key=None,
+            lifetime=ServiceLifetime.SINGLETON,
+            auto_activate=False,
+        )
+        second_descriptor = ServiceDescriptor.from_implementation_type(
+            service_type=ServiceWithNoDependencies,
+            implementation_type=ServiceWithNoDependencies,
+            service_key=None,
+            lifetime=ServiceLifetime.TRANSIENT,
+            auto_activate=False,
+        )
+        call_site_factory = CallSiteFactory([first_descriptor, second_descriptor])
+
+        first_call_site = await call_site_factory.get_call_site_from_service_descriptor(
+            first_descriptor, CallSiteChain()
+        )
+        second_call_site = (
+            await call_site_factory.get_call_site_from_service_descriptor(
+                second_descriptor, CallSiteChain()
+            )
+        )
+
+        assert isinstance(first_call_site, ConstructorCallSite)
+        assert isinstance(second_call_site, ConstructorCallSite)
+        assert first_call_site is not second_call_site
+        assert (
+            first_call_site.constructor_information
+            is second_call_site.constructor_information
+        )
+        assert first_call_site.parameters is second_call_site.parameters
+
+    def test_not_have_instance_dictionary_when_descriptor_cache_item(self) -> None:
+        cache_item = ServiceDescriptorCacheItem()
+
+        assert not hasattr(cache_item, "__dict__")
+
+    def test_return_any_key_override_for_keyed_service_only_while_it_is_active(
+        self,
+    ) -> None:
+        service_type = TypedType.from_type(ServiceWithNoDependencies)
+        keyed_service_identifier = ServiceIdentifier.from_service_type(
+            service_type=service_type, service_key="key"
+        )
+        call_site_factory = CallSiteFactory([])
+        override_instance = ServiceWithNoDependencies()
+
+        with call_site_factory.override_service(
+            service_identifier=ServiceIdentifier.from_service_type(
+                service_type=service_type, service_key=KeyedService.ANY_KEY
+            ),
+            implementation_instance=override_instance,
+        ):
+            call_site = call_site_factory.get_overridden_call_site(
+                keyed_service_identifier
+            )
+
+        assert isinstance(call_site, ConstantCallSite)
+        assert call_site.default_value is override_instance
+        assert (
+            call_site_factory.get_overridden_call_site(keyed_service_identifier) is None
+        )
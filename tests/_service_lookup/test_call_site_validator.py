@@ -1,5 +1,7 @@
 from collections.abc import AsyncGenerator, Generator, Sequence
 
+from pytest_mock import MockerFixture
+
 from tests.utils.services import ServiceWithNoDependencies
 from wirio._service_lookup._async_factory_call_site import AsyncFactoryCallSite
 from wirio._service_lookup._async_generator_factory_call_site import (
@@ -168,6 +170,29 @@ class TestCallSiteValidator:
             async with service_provider.create_scope() as service_scope:
                 validator.validate_resolution(call_site, service_scope, root_scope)
 
+    async def test_not_visit_call_site_tree_again_when_it_has_no_scoped_services(
+        self, mocker: MockerFixture
+    ) -> None:
+        service_type = TypedType.from_type(ServiceWithNoDependencies)
+        call_site = ConstructorCallSite(
+            cache=ResultCache.from_lifetime(
+                lifetime=ServiceLifetime.SINGLETON,
+                service_identifier=ServiceIdentifier.from_service_type(service_type),
+                slot=0,
+            ),
+            service_type=service_type,
+            constructor_information=ConstructorInformation(service_type),
+            parameters=[],
+            parameter_call_sites=[],
+        )
+        validator = CallSiteValidator()
+        visit_constructor_spy = mocker.spy(validator, "_visit_constructor")
+
+        await validator.validate_call_site(call_site)
+        await validator.validate_call_site(call_site)
+
+        visit_constructor_spy.assert_called_once()
+
     async def _assert_not_fail_when_resolving_from_root(
         self, call_site: ServiceCallSite
     ) -> None:
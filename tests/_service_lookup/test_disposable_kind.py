@@ -0,0 +1,48 @@
+import gc
+import weakref
+
+import pytest
+
+from tests.utils.services import (
+    ServiceWithAsyncContextManagerAndNoDependencies,
+    ServiceWithSyncContextManagerAndNoDependencies,
+)
+from wirio._service_lookup._disposable_kind import DisposableKind
+
+
+class TestDisposableKind:
+    @pytest.mark.parametrize(
+        argnames=("instance", "expected_disposable_kind"),
+        argvalues=[
+            (ServiceWithAsyncContextManagerAndNoDependencies(), DisposableKind.ASYNC),
+            (ServiceWithSyncContextManagerAndNoDependencies(), DisposableKind.SYNC),
+            (object(), DisposableKind.NONE),
+            (None, DisposableKind.NONE),
+        ],
+    )
+    def test_get_disposable_kind_from_instance(
+        self, instance: object | None, expected_disposable_kind: DisposableKind
+    ) -> None:
+        disposable_kind = DisposableKind.from_instance(instance)
+
+        assert disposable_kind is expected_disposable_kind
+
+    def test_reuse_disposable_kind_for_instances_of_same_type(self) -> None:
+        disposable_kind_1 = DisposableKind.from_instance(
+            ServiceWithSyncContextManagerAndNoDependencies()
+        )
+        disposable_kind_2 = DisposableKind.from_instance(
+            ServiceWithSyncContextManagerAndNoDependencies()
+        )
+
+        assert disposable_kind_1 is disposable_kind_2 is DisposableKind.SYNC
+
+    def test_not_keep_type_of_instance_alive(self) -> None:
+        instance_type = type("RuntimeService", (), {})
+        DisposableKind.from_instance(instance_type())
+        instance_type_reference = weakref.ref(instance_type)
+
+        del instance_type
+        gc.collect()
+
+        assert instance_type_reference() is None
@@ -0,0 +1,56 @@
+from collections.abc import AsyncGenerator
+
+from wirio._service_lookup._implementation_factory_information import (
+    ImplementationFactoryInformation,
+)
+from wirio._service_lookup._implementation_factory_kind import (
+    ImplementationFactoryKind,
+)
+
+
+async def _async_generator_implementation_factory() -> AsyncGenerator[int]:
+    yield 1
+
+
+class TestImplementationFactoryInformation:
+    def test_reuse_information_for_same_implementation_factory(self) -> None:
+        implementation_factory_information_1 = (
+            ImplementationFactoryInformation.from_implementation_factory(
+                _async_generator_implementation_factory
+            )
+        )
+        implementation_factory_information_2 = (
+            ImplementationFactoryInformation.from_implementation_factory(
+                _async_generator_implementation_factory
+            )
+        )
+
+        assert (
+            implementation_factory_information_1 is implementation_factory_information_2
+        )
+        assert (
+            implementation_factory_information_1.kind
+            is ImplementationFactoryKind.ASYNC_GENERATOR
+        )
+
+    def test_return_yielded_type_of_generator_implementation_factory(self) -> None:
+        implementation_factory_information = (
+            ImplementationFactoryInformation.from_implementation_factory(
+                _async_generator_implementation_factory
+            )
+        )
+
+        return_type = implementation_factory_information.get_return_type(
+            _async_generator_implementation_factory
+        )
+
+        assert return_type is int
+
+    def test_get_information_when_implementation_factory_cannot_be_weakly_referenced(
+        self,
+    ) -> None:
+        implementation_factory_information = (
+            ImplementationFactoryInformation.from_implementation_factory(len)
+        )
+
+        assert implementation_factory_information.kind is ImplementationFactoryKind.SYNC
@@ -0,0 +1,54 @@
+from collections.abc import AsyncGenerator, Callable, Generator
+from typing import Any
+
+import pytest
+
+from wirio._service_lookup._implementation_factory_kind import (
+    ImplementationFactoryKind,
+)
+
+
+def _sync_implementation_factory() -> int:
+    return 1
+
+
+async def _async_implementation_factory() -> int:
+    return 1
+
+
+def _sync_generator_implementation_factory() -> Generator[int]:
+    yield 1
+
+
+async def _async_generator_implementation_factory() -> AsyncGenerator[int]:
+    yield 1
+
+
+class TestImplementationFactoryKind:
+    @pytest.mark.parametrize(
+        argnames=("implementation_factory", "expected_implementation_factory_kind"),
+        argvalues=[
+            (_sync_implementation_factory, ImplementationFactoryKind.SYNC),
+            (_async_implementation_factory, ImplementationFactoryKind.ASYNC),
+            (
+                _sync_generator_implementation_factory,
+                ImplementationFactoryKind.SYNC_GENERATOR,
+            ),
+            (
+                _async_generator_implementation_factory,
+                ImplementationFactoryKind.ASYNC_GENERATOR,
+            ),
+        ],
+    )
+    def test_get_implementation_factory_kind_from_implementation_factory(
+        self,
+        implementation_factory: Callable[..., Any],
+        expected_implementation_factory_kind: ImplementationFactoryKind,
+    ) -> None:
+        implementation_factory_kind = (
+            ImplementationFactoryKind.from_implementation_factory(
+                implementation_factory
+            )
+        )
+
+        assert implementation_factory_kind is expected_implementation_factory_kind
@@ -34,3 +34,14 @@ class TestSequenceCallSite:
         )
 
         assert service_call_site.service_type == expected_type
+
+    def test_not_have_instance_dictionary(self) -> None:
+        type_ = TypedType.from_type(ServiceWithNoDependencies)
+
+        service_call_site = SequenceCallSite(
+            result_cache=ResultCache.none(type_),
+            item_type=type_,
+            service_call_sites=[],
+        )
+
+        assert not hasattr(service_call_site, "__dict__")
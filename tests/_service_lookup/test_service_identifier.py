@@ -99,3 +99,40 @@ class TestServiceIdentifier:
         )
 
         assert str(service_identifier) == f"({service_key}, {service_type!r})"
+
+    def test_keep_hash_consistent_with_equality(self) -> None:
+        service_identifier_1 = ServiceIdentifier(
+            service_key="key", service_type=TypedType.from_type(int)
+        )
+        service_identifier_2 = ServiceIdentifier(
+            service_key="key", service_type=TypedType.from_type(int)
+        )
+
+        assert service_identifier_1 == service_identifier_2
+        assert hash(service_identifier_1) == hash(service_identifier_2)
+
+    def test_reuse_instance_when_creating_from_same_service_type_and_key(
+        self,
+    ) -> None:
+        service_identifier_1 = ServiceIdentifier.from_service_type(
+            service_type=TypedType.from_type(int), service_key="key"
+        )
+        service_identifier_2 = ServiceIdentifier.from_service_type(
+            service_type=TypedType.from_type(int), service_key="key"
+        )
+
+        assert service_identifier_1 is service_identifier_2
+
+    def test_reuse_instance_when_creating_with_positional_and_keyword_arguments(
+        self,
+    ) -> None:
+        service_type = TypedType.from_type(int)
+        service_identifier_1 = ServiceIdentifier.from_service_type(service_type, "key")
+        service_identifier_2 = ServiceIdentifier.from_service_type(
+            service_type=service_type, service_key="key"
+        )
+
+        assert service_identifier_1 is service_identifier_2
+        assert service_identifier_1 == ServiceIdentifier(
+            service_key="key", service_type=service_type
+        )
@@ -1,4 +1,6 @@
+import gc
 import sys
+import weakref
 from typing import cast
 
 import pytest
@@ -79,6 +81,11 @@ class TestTypedType:
                 "tests._service_lookup.test_typed_type.CustomClassWithGenerics1[builtins.int, builtins.str]",
                 "tests._service_lookup.test_typed_type.CustomClassWithGenerics1[builtins.int, builtins.str]",
             ),
+            (
+                CustomClassWithGenerics1[int, int],
+                "tests._service_lookup.test_typed_type.CustomClassWithGenerics1[builtins.int, builtins.int]",
+                "tests._service_lookup.test_typed_type.CustomClassWithGenerics1[builtins.int, builtins.int]",
+            ),
             (
                 int | str,
                 "types.UnionType[builtins.int, builtins.str]",
@@ -286,3 +293,32 @@ class TestTypedType:
         assert isinstance(instance, CustomClassWithGenericAndConstructorParameters)
         assert instance.parameter_1 == expected_parameter_1
         assert instance.parameter_2 == expected_parameter_2
+
+    def test_reuse_instance_when_type_is_class(self) -> None:
+        assert TypedType.from_type(CustomClass) is TypedType.from_type(CustomClass)
+
+    def test_keep_argument_order_when_unions_are_equal(self) -> None:
+        typed_type_1 = TypedType.from_type(cast("type", int | str))
+        typed_type_2 = TypedType.from_type(cast("type", str | int))
+
+        assert typed_type_1 != typed_type_2
+
+    def test_not_have_instance_dictionary(self) -> None:
+        typed_type = TypedType.from_type(CustomClassWithGeneric1[int])
+
+        assert not hasattr(typed_type, "__dict__")
+
+    def test_not_keep_class_alive_when_evicted_from_reused_instances(self) -> None:
+        class_ = type("RuntimeClass", (), {})
+        TypedType.from_type(class_)
+        class_reference = weakref.ref(class_)
+        del class_
+        maxsize = TypedType._from_class.cache_info().maxsize  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+        assert maxsize is not None
+
+        for i in range(maxsize):
+            TypedType.from_type(type(f"OtherRuntimeClass{i}", (), {}))
+
+        gc.collect()
+
+        assert class_reference() is None
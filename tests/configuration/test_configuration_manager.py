@@ -1,3 +1,4 @@
+import asyncio
 from typing import TYPE_CHECKING, Any, final, override
 
 import pytest
@@ -9,6 +10,7 @@ from wirio.configuration.configuration_builder import ConfigurationBuilder
 from wirio.configuration.configuration_manager import ConfigurationManager
 from wirio.configuration.configuration_provider import ConfigurationProvider
 from wirio.configuration.configuration_source import ConfigurationSource
+from wirio.wirio_undefined import WirioUndefined
 
 if TYPE_CHECKING:
     from azure.core.credentials_async import AsyncTokenCredential
@@ -56,6 +58,36 @@ class _DictionaryConfigurationSource(ConfigurationSource):
         return _DictionaryConfigurationProvider(self._values)
 
 
+@final
+class _UppercaseConfigurationProvider(ConfigurationProvider):
+    _values: dict[str, str | None]
+
+    def __init__(self, values: dict[str, str | None]) -> None:
+        super().__init__()
+        self._values = values
+
+    @override
+    def try_get(self, key: str) -> str | None | WirioUndefined:
+        value = self._values.get(key, WirioUndefined.INSTANCE)
+
+        if isinstance(value, str):
+            return value.upper()
+
+        return value
+
+
+@final
+class _UppercaseConfigurationSource(ConfigurationSource):
+    _values: dict[str, str | None]
+
+    def __init__(self, values: dict[str, str | None]) -> None:
+        self._values = values
+
+    @override
+    def build(self, builder: ConfigurationBuilder) -> ConfigurationProvider:
+        return _UppercaseConfigurationProvider(self._values)
+
+
 class _Settings(BaseModel):
     app_name: str
     port: str
@@ -395,3 +427,44 @@ class TestConfigurationManager:
         configuration_value = section.get_value()
 
         assert configuration_value is None
+
+    def test_get_value_from_provider_that_overrides_try_get(self) -> None:
+        configuration_manager = ConfigurationManager(content_root_path="")
+        configuration_manager.add(
+            _DictionaryConfigurationSource({"app_name": "wirio", "port": "8080"})
+        )
+        configuration_manager.add(_UppercaseConfigurationSource({"app_name": "wirio"}))
+
+        settings = configuration_manager.get_model(_Settings)
+
+        assert settings.app_name == "WIRIO"
+        assert settings.port == "8080"
+
+    def test_not_start_thread_when_adding_source_and_event_loop_is_not_running(
+        self, mocker: MockerFixture
+    ) -> None:
+        thread_patch = mocker.patch(
+            "wirio.configuration.configuration_manager.Thread", autospec=True
+        )
+        configuration_manager = ConfigurationManager(content_root_path="")
+        configuration_manager.add(_DictionaryConfigurationSource({"app_name": "wirio"}))
+
+        thread_patch.assert_not_called()
+        assert configuration_manager.get_value("app_name") == "wirio"
+
+    def test_keep_current_event_loop_when_adding_source_and_event_loop_is_not_running(
+        self,
+    ) -> None:
+        event_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(event_loop)
+
+        try:
+            configuration_manager = ConfigurationManager(content_root_path="")
+            configuration_manager.add(
+                _DictionaryConfigurationSource({"app_name": "wirio"})
+            )
+
+            assert asyncio.get_event_loop() is event_loop
+        finally:
+            asyncio.set_event_loop(None)
+            event_loop.close()
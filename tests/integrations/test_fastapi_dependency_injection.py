@@ -20,12 +20,16 @@ if TYPE_CHECKING:
     from fastapi import APIRouter, Depends, FastAPI
     from fastapi.testclient import TestClient
 
+    from wirio.integrations._fastapi_dependency_injection import (
+        FastapiDependencyInjection,
+    )
     from wirio.integrations.fastapi import get_service_container, get_service_provider
 else:
     APIRouter = Any
     Depends = Any
     FastAPI = Any
     TestClient = Any
+    FastapiDependencyInjection = Any
     get_service_container = Any
     get_service_provider = Any
 
@@ -33,6 +37,9 @@ try:
     from fastapi import APIRouter, Depends, FastAPI
     from fastapi.testclient import TestClient
 
+    from wirio.integrations._fastapi_dependency_injection import (
+        FastapiDependencyInjection,
+    )
     from wirio.integrations.fastapi import get_service_container, get_service_provider
 except ImportError:
     pass
@@ -386,3 +393,50 @@ class TestFastapiDependencyInjection:
             assert response.status_code == HTTPStatus.OK
             content_root_path = response.json()
             assert content_root_path == expected_content_root_path
+
+    def test_get_parameters_to_inject_once_per_endpoint(
+        self, mocker: MockerFixture
+    ) -> None:
+        get_parameters_to_inject_spy = mocker.spy(
+            FastapiDependencyInjection, "_get_parameters_to_inject"
+        )
+        app = FastAPI()
+
+        @app.get("/endpoint")
+        async def endpoint(  # pyright: ignore[reportUnusedFunction]
+            service: Annotated[ServiceWithNoDependencies, FromServices()],
+        ) -> None:
+            assert isinstance(service, ServiceWithNoDependencies)
+
+        services = ServiceCollection()
+        services.configure_fastapi(app)
+        services.add_transient(ServiceWithNoDependencies)
+
+        with TestClient(app) as test_client:
+            first_response = test_client.get("/endpoint")
+            second_response = test_client.get("/endpoint")
+
+        assert first_response.status_code == HTTPStatus.OK
+        assert second_response.status_code == HTTPStatus.OK
+        get_parameters_to_inject_spy.assert_called_once()
+
+    def test_not_create_scope_for_endpoints_without_injected_parameters(
+        self, mocker: MockerFixture
+    ) -> None:
+        app = FastAPI()
+
+        @app.get("/endpoint")
+        async def endpoint() -> None:  # pyright: ignore[reportUnusedFunction]
+            pass
+
+        services = ServiceCollection()
+        services.configure_fastapi(app)
+
+        with TestClient(app) as test_client:
+            create_scope_spy = mocker.spy(
+                app.state.wirio_service_provider, "create_scope"
+            )
+            response = test_client.get("/endpoint")
+
+        assert response.status_code == HTTPStatus.OK
+        create_scope_spy.assert_not_called()
@@ -118,3 +118,31 @@ class TestServiceProviderEngineScope:
                 await engine_scope.capture_disposable(service)
 
             assert service.is_disposed
+
+    async def test_create_scope_without_instance_dictionary(self) -> None:
+        services = ServiceCollection()
+
+        async with (
+            services.build_service_provider() as service_provider,
+            service_provider.create_scope() as service_scope,
+        ):
+            assert isinstance(service_scope, ServiceProviderEngineScope)
+            assert not hasattr(service_scope, "__dict__")
+
+    async def test_dispose_scope_several_times_without_resolving_services(
+        self,
+    ) -> None:
+        services = ServiceCollection()
+
+        async with services.build_service_provider() as service_provider:
+            service_scope = service_provider.create_scope()
+
+            async with service_scope:
+                pass
+
+            await service_scope.__aexit__(None, None, None)
+
+            with pytest.raises(ObjectDisposedError):
+                await service_scope.get_service(
+                    ServiceWithAsyncContextManagerAndNoDependencies
+                )
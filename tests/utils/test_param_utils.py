@@ -0,0 +1,37 @@
+from inspect import Parameter
+from typing import Annotated
+
+from wirio._utils._param_utils import ParamUtils
+from wirio.annotations import FromServicesInjectable
+
+
+class TestParamUtils:
+    def test_return_same_injectable_dependency_for_same_annotation(self) -> None:
+        annotation = Annotated[int, FromServicesInjectable()]
+        first_parameter = Parameter(
+            "first", Parameter.POSITIONAL_OR_KEYWORD, annotation=annotation
+        )
+        second_parameter = Parameter(
+            "second", Parameter.POSITIONAL_OR_KEYWORD, annotation=annotation
+        )
+
+        first_injectable_dependency = ParamUtils.get_injectable_dependency(
+            first_parameter
+        )
+        second_injectable_dependency = ParamUtils.get_injectable_dependency(
+            second_parameter
+        )
+
+        assert isinstance(first_injectable_dependency, FromServicesInjectable)
+        assert first_injectable_dependency is second_injectable_dependency
+
+    def test_return_none_when_annotation_metadata_is_not_hashable(self) -> None:
+        parameter = Parameter(
+            "parameter",
+            Parameter.POSITIONAL_OR_KEYWORD,
+            annotation=Annotated[int, ["not-hashable"]],
+        )
+
+        injectable_dependency = ParamUtils.get_injectable_dependency(parameter)
+
+        assert injectable_dependency is None